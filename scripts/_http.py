@@ -0,0 +1,58 @@
+"""
+Script: _http.py
+Intent:
+- snapshot
+
+Reads:
+- Orchestrator API (pooled session, /health endpoint)
+
+Writes:
+- None
+
+Schema:
+- N/A (shared API session and health probe for execution__spawn_agents.py
+  and fix_workflow.py)
+"""
+
+import time
+from typing import Dict, Tuple
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+# Shared keep-alive session so API calls reuse one pooled connection
+# (None when requests is not installed)
+SESSION = None
+if REQUESTS_AVAILABLE:
+    SESSION = requests.Session()
+    SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Last /health probe result per URL, reused for HEALTH_TTL_SECONDS
+HEALTH_TTL_SECONDS = 5.0
+_health_cache: Dict[str, Tuple[float, bool]] = {}
+
+
+def check_health(url: str, force_refresh: bool = False) -> bool:
+    """
+    Return True if GET url answers 200 (always False without requests).
+
+    The result is cached for a few seconds so repeated checks within one run
+    don't repeat the HTTP round-trip (or its timeout). Pass
+    force_refresh=True to probe again.
+    """
+    if SESSION is None:
+        return False
+    cached = _health_cache.get(url)
+    if not force_refresh and cached is not None and time.monotonic() - cached[0] < HEALTH_TTL_SECONDS:
+        return cached[1]
+    try:
+        response = SESSION.get(url, timeout=2)
+        ok = response.status_code == 200
+    except Exception:
+        ok = False
+    _health_cache[url] = (time.monotonic(), ok)
+    return ok
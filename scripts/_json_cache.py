@@ -0,0 +1,93 @@
+"""
+Script: _json_cache.py
+Intent:
+- temporal
+
+Reads:
+- Any JSON file passed to get_json() or open_maybe_gz() (state, registry,
+  development config), plain or gzip-compressed
+
+Writes:
+- None (in-process cache only)
+
+Schema:
+- N/A (shared loader for dev__status_dashboard.py and dev__workflow.py)
+"""
+
+import gzip
+import io
+import json
+import mmap
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Leading bytes of every gzip stream
+GZIP_MAGIC = b'\x1f\x8b'
+
+# path -> ((mtime_ns, size), parsed data)
+_CACHE: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
+
+
+def get_json(path: Path) -> Any:
+    """
+    Parse a JSON file, reusing the previous parse while the file is unchanged.
+
+    The cache is keyed on (mtime_ns, size), so repeated loads of the same
+    file within one process cost a single stat(). Returned objects are
+    shared between callers and must not be mutated.
+
+    Args:
+        path: JSON file to load (must exist)
+
+    Returns:
+        Parsed JSON, or {} for an empty file. Gzip-compressed files are
+        detected by their magic bytes and decompressed transparently.
+    """
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+
+    cached = _CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    data = path.read_bytes()
+    if data[:2] == GZIP_MAGIC:
+        data = gzip.decompress(data)
+    if not data:
+        parsed = {}
+    else:
+        parsed = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+    _CACHE[path] = (key, parsed)
+    return parsed
+
+
+@contextmanager
+def open_maybe_gz(path: Path) -> Iterator[BinaryIO]:
+    """
+    Open a JSON file for streaming (e.g. with ijson), plain or gzipped.
+    
+    Gzip files are detected by their magic bytes and decompressed on the
+    fly. Plain files are memory-mapped. mmap cannot map zero bytes, so an
+    empty file reads as "{}", matching get_json().
+    
+    Args:
+        path: JSON file to open (must exist)
+    """
+    with open(path, 'rb') as f:
+        if f.read(2) == GZIP_MAGIC:
+            f.seek(0)
+            with gzip.GzipFile(fileobj=f) as gz:
+                yield gz
+        elif not path.stat().st_size:
+            yield io.BytesIO(b"{}")
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield mm
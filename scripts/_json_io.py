@@ -0,0 +1,119 @@
+"""
+Script: _json_io.py
+Intent:
+- temporal
+
+Reads:
+- Any JSON file passed to read_json()
+- Any JSONL file passed to load_jsonl()
+
+Writes:
+- Any JSON file passed to write_json()
+
+Schema:
+- N/A (shared JSON I/O for generate_policy_opportunity_artifacts.py,
+  hr_pre_hygiene.py and the metrics__* KPI/dashboard scripts)
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# datetime values serialize as ISO-8601 UTC with a "Z" suffix (naive = UTC)
+_ORJSON_DATETIME_OPTS = orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC if ORJSON_AVAILABLE else 0
+
+# Raised by read_json()/loads() on malformed input with either backend
+# (orjson.JSONDecodeError subclasses it)
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes) -> Any:
+    """Parse JSON from bytes (orjson when available)."""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def _json_default(obj: Any) -> str:
+    """Fallback-encoder hook producing the same datetime format as orjson."""
+    if isinstance(obj, datetime):
+        if obj.tzinfo is None:
+            return obj.isoformat() + "Z"
+        return obj.astimezone(timezone.utc).isoformat().replace('+00:00', 'Z')
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, indent: bool = True) -> bytes:
+    """
+    Serialize obj to UTF-8 JSON bytes.
+
+    Non-ASCII text is written as-is (like ensure_ascii=False) and non-string
+    dict keys are converted to strings, as the json module does. datetime
+    values are written as ISO-8601 UTC strings ending in "Z".
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | _ORJSON_DATETIME_OPTS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(
+        obj, indent=2 if indent else None, ensure_ascii=False, default=_json_default
+    ).encode('utf-8')
+
+
+def read_json(path: Path) -> Any:
+    """Read and parse a JSON file in a single read."""
+    return loads(path.read_bytes())
+
+
+def load_jsonl(path: Path) -> Iterator[Any]:
+    """
+    Stream records from a JSONL file without materializing the whole log.
+
+    Yields nothing if the file is missing. Malformed lines (e.g. a partially
+    appended last line) are skipped, since records already yielded cannot be
+    withdrawn. Use sum(1 for _ in load_jsonl(path)) for a count.
+    """
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return
+    with f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield loads(line)
+            except JSONDecodeError:
+                continue
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Replace path with data so readers never see a partially written file.
+
+    The data is written to a sibling temp file (named per process, so
+    concurrent writers do not share it) and renamed over the target.
+    """
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def write_json(path: Path, obj: Any, indent: bool = True) -> None:
+    """Serialize obj and atomically write it to path as UTF-8."""
+    atomic_write_bytes(path, dumps(obj, indent=indent))
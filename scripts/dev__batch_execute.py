@@ -14,103 +14,135 @@ Schema:
 - N/A (batch execution script)
 """
 
+import asyncio
 import json
+import os
 import sys
 from pathlib import Path
+from types import MappingProxyType
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Path setup
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-try:
-    from app.agent_spawner import AgentSpawner
-    from app.agent_executor import AgentExecutor
-    from app.models import LegislativeState
-except ImportError as e:
-    print(f"[ERROR] Failed to import required modules: {e}")
-    sys.exit(1)
-
 # Constants
 BASE_DIR = PROJECT_ROOT
 STATE_PATH = BASE_DIR / "state" / "legislative-state.json"
 REGISTRY_PATH = BASE_DIR / "registry" / "agent-registry.json"
 
+# Map of state to Intelligence agents (built once at import, read-only)
+_INTEL_AGENTS_BY_STATE = MappingProxyType({
+    "PRE_EVT": (
+        "intel_signal_scan_pre_evt",
+        "intel_stakeholder_map_pre_evt",
+        "intel_opposition_detect_pre_evt",
+        "intel_policy_context_analyzer_pre_evt"
+    ),
+    "INTRO_EVT": (
+        "intel_signal_scan_intro_evt",
+        "intel_stakeholder_map_intro_evt"
+    ),
+    "COMM_EVT": (
+        "intel_signal_scan_comm_evt",
+        "intel_stakeholder_map_comm_evt"
+    ),
+    "FLOOR_EVT": (
+        "intel_signal_scan_floor_evt",
+    ),
+    "FINAL_EVT": (
+        "intel_signal_scan_final_evt",
+    ),
+    "IMPL_EVT": (
+        "intel_signal_scan_impl_evt",
+    )
+})
+
 
 def load_workflow_state() -> Dict[str, Any]:
     """Load workflow state."""
     if not STATE_PATH.exists():
         raise FileNotFoundError(f"State file not found: {STATE_PATH}")
-    with open(STATE_PATH, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    data = STATE_PATH.read_bytes()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
 
 
-def get_intelligence_agents_for_state(legislative_state: str) -> List[str]:
+def get_intelligence_agents_for_state(legislative_state: str) -> Tuple[str, ...]:
     """
-    Get list of Intelligence agent IDs for a given state.
+    Get Intelligence agent IDs for a given state.
     
     Args:
         legislative_state: Current legislative state
         
     Returns:
-        List of Intelligence agent IDs
+        Tuple of Intelligence agent IDs (empty if the state is unknown)
     """
-    # Map of state to Intelligence agents
-    agent_map = {
-        "PRE_EVT": [
-            "intel_signal_scan_pre_evt",
-            "intel_stakeholder_map_pre_evt",
-            "intel_opposition_detect_pre_evt",
-            "intel_policy_context_analyzer_pre_evt"
-        ],
-        "INTRO_EVT": [
-            "intel_signal_scan_intro_evt",
-            "intel_stakeholder_map_intro_evt"
-        ],
-        "COMM_EVT": [
-            "intel_signal_scan_comm_evt",
-            "intel_stakeholder_map_comm_evt"
-        ],
-        "FLOOR_EVT": [
-            "intel_signal_scan_floor_evt"
-        ],
-        "FINAL_EVT": [
-            "intel_signal_scan_final_evt"
-        ],
-        "IMPL_EVT": [
-            "intel_signal_scan_impl_evt"
-        ]
-    }
+    return _INTEL_AGENTS_BY_STATE.get(legislative_state, ())
+
+
+def recommended_max_workers(concurrency: int) -> int:
+    """
+    Recommend an executor pool size for I/O-bound agent work.
+    
+    Intelligence agents spend most of their time waiting on APIs and disk,
+    so the pool scales with the workload up to 8 workers per CPU core.
     
-    return agent_map.get(legislative_state, [])
+    Args:
+        concurrency: Number of agents that may run at once
+        
+    Returns:
+        Worker count (at least 1)
+    """
+    return max(1, min(concurrency, (os.cpu_count() or 1) * 8))
 
 
 def batch_execute_development_agents(
     workflow_id: str,
-    agent_ids: List[str],
+    agent_ids: Sequence[str],
     max_concurrent: int = 2,
-    priority: int = 10
+    priority: int = 10,
+    max_workers: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Execute multiple development agents in batch.
     
+    Intelligence agents are read-only and network/disk bound, so submission
+    runs in threads (asyncio.to_thread) and AgentExecutor is expected to use
+    a thread pool. Do not switch this path to a process pool: each worker
+    process costs far more memory than a thread without improving
+    throughput on I/O-bound work, which matters on dev laptops.
+    
     Args:
         workflow_id: Workflow identifier
         agent_ids: List of agent IDs to execute
-        max_concurrent: Maximum concurrent executions
+        max_concurrent: Maximum in-flight submissions (the executor pool
+            size, max_workers, limits how many agents run at once)
         priority: Priority level for all agents
+        max_workers: Executor pool size (default: recommended_max_workers(len(agent_ids)))
         
     Returns:
-        Execution results
+        Execution results (raises ImportError if the app package is missing)
     """
+    # Imported lazily so no-op paths don't pay for the app package import
+    from app.agent_executor import AgentExecutor
+    
+    if max_workers is None:
+        max_workers = recommended_max_workers(len(agent_ids))
+    
     print(f"Batch executing {len(agent_ids)} development agents...")
     print("-" * 70)
     
-    # Create executor
+    # Create executor (thread-backed; see docstring)
     executor = AgentExecutor(
         workflow_id=workflow_id,
-        max_workers=max_concurrent
+        max_workers=max_workers
     )
     
     if not executor.is_running():
@@ -123,55 +155,72 @@ def batch_execute_development_agents(
         "agent_ids": []
     }
     
-    for agent_id in agent_ids:
-        try:
-            # Determine agent type from ID
-            if agent_id.startswith("intel_"):
-                agent_type = "Intelligence"
-                risk_level = "LOW"
-            else:
-                agent_type = "Intelligence"
-                risk_level = "LOW"
-            
-            # Execute agent with high priority
-            executor.execute_agent(
-                agent_id=agent_id,
-                workflow_id=workflow_id,
-                agent_type=agent_type,
-                scope=f"Development batch - {agent_id}",
-                risk_level=risk_level,
-                metadata={
-                    "development_mode": True,
-                    "batch_execution": True,
-                    "priority": priority,
-                    "spawned_at": datetime.now(timezone.utc).isoformat()
-                }
-            )
-            
+    # All agents in a batch share one spawn timestamp
+    spawned_at = datetime.now(timezone.utc).isoformat()
+    
+    def queue_agent(agent_id: str) -> None:
+        # Development batches only run Intelligence agents
+        executor.execute_agent(
+            agent_id=agent_id,
+            workflow_id=workflow_id,
+            agent_type="Intelligence",
+            scope=f"Development batch - {agent_id}",
+            risk_level="LOW",
+            metadata={
+                "development_mode": True,
+                "batch_execution": True,
+                "priority": priority,
+                "spawned_at": spawned_at
+            }
+        )
+    
+    async def submit_all() -> List[Any]:
+        # Overlap submissions in worker threads, at most max_concurrent at a time
+        semaphore = asyncio.Semaphore(max_concurrent)
+        
+        async def submit(agent_id: str) -> None:
+            async with semaphore:
+                await asyncio.to_thread(queue_agent, agent_id)
+        
+        return await asyncio.gather(
+            *(submit(agent_id) for agent_id in agent_ids),
+            return_exceptions=True
+        )
+    
+    outcomes = asyncio.run(submit_all())
+    
+    # gather() preserves input order, so report in the original agent order
+    for agent_id, outcome in zip(agent_ids, outcomes):
+        if isinstance(outcome, Exception):
+            results["failed"] += 1
+            print(f"  [FAIL] Failed to queue {agent_id}: {outcome}")
+        else:
             results["queued"] += 1
             results["agent_ids"].append(agent_id)
             print(f"  [OK] Queued {agent_id}")
-            
-        except Exception as e:
-            results["failed"] += 1
-            print(f"  [FAIL] Failed to queue {agent_id}: {e}")
     
-    print()
-    print(f"Batch execution summary:")
-    print(f"  Total: {results['total']}")
-    print(f"  Queued: {results['queued']}")
-    print(f"  Failed: {results['failed']}")
-    print()
+    sys.stdout.write(
+        "\n"
+        "Batch execution summary:\n"
+        f"  Total: {results['total']}\n"
+        f"  Queued: {results['queued']}\n"
+        f"  Failed: {results['failed']}\n"
+        "\n"
+    )
     
     return results
 
 
 def main():
     """Main batch execution."""
-    print("=" * 70)
-    print("DEVELOPMENT BATCH EXECUTION")
-    print("=" * 70)
-    print()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Batch execute development Intelligence agents")
+    parser.add_argument("--max-workers", type=int, default=None,
+                        help="Executor pool size (default: min(agent count, CPU count * 8))")
+    args = parser.parse_args()
+    
+    sys.stdout.write("=" * 70 + "\nDEVELOPMENT BATCH EXECUTION\n" + "=" * 70 + "\n\n")
     
     try:
         # Load state
@@ -200,25 +249,30 @@ def main():
         results = batch_execute_development_agents(
             workflow_id=workflow_id,
             agent_ids=agent_ids,
-            max_concurrent=2,  # Limit concurrent execution
-            priority=10  # High priority for development
+            max_concurrent=2,  # Maximum in-flight submissions
+            priority=10,  # High priority for development
+            max_workers=args.max_workers
         )
         
-        print("=" * 70)
-        print("BATCH EXECUTION COMPLETE")
-        print("=" * 70)
-        print()
-        print("Next steps:")
-        print("  1. Monitor execution: python scripts\\dev__monitor_resource_usage.py")
-        print("  2. Check agent status: registry\\agent-registry.json")
-        print("  3. Review outputs: artifacts\\<agent_id>\\")
+        sys.stdout.write("\n".join([
+            "=" * 70,
+            "BATCH EXECUTION COMPLETE",
+            "=" * 70,
+            "",
+            "Next steps:",
+            "  1. Monitor execution: python scripts\\dev__monitor_resource_usage.py",
+            "  2. Check agent status: registry\\agent-registry.json",
+            "  3. Review outputs: artifacts\\<agent_id>\\",
+        ]) + "\n")
         
         return 0
         
+    except ImportError as e:
+        print(f"[ERROR] Failed to import required modules: {e}")
+        return 1
     except Exception as e:
-        print(f"[ERROR] {e}", file=sys.stderr)
         import traceback
-        traceback.print_exc()
+        sys.stderr.write(f"[ERROR] {e}\n" + "".join(traceback.format_exception(e)))
         return 1
 
 
@@ -20,6 +20,12 @@ from pathlib import Path
 from datetime import datetime, timezone
 from typing import Dict, Any
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Path setup
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
@@ -30,73 +36,83 @@ CONFIG_DIR = BASE_DIR / "config"
 CONFIG_DIR.mkdir(exist_ok=True)
 DEV_CONFIG_PATH = CONFIG_DIR / "development_config.json"
 
+# Static development configuration; only _meta.generated_at varies per run
+_CONFIG_TEMPLATE = {
+    "_meta": {
+        "config_type": "DEVELOPMENT_RESOURCE_ALLOCATION",
+        "generated_at": None,  # filled in by create_development_config()
+        "purpose": "Development-specific agent resource allocation settings",
+        "read_only": False,
+        "authoritative": False
+    },
+    "execution_limits": {
+        "max_concurrent_agents": 4,
+        "development_workers": 4,
+        "production_workers": 2,
+        "note": "Reserve 4 workers for development, 2 for production"
+    },
+    "agent_type_allocation": {
+        "intelligence_workers": 4,
+        "drafting_workers": 2,
+        "execution_workers": 1,
+        "learning_workers": 1,
+        "note": "Allocate more resources to Intelligence agents (read-only, safe for development)"
+    },
+    "priority_levels": {
+        "development_priority": 10,
+        "production_priority": 1,
+        "testing_priority": 5,
+        "note": "Higher priority = executed first. Development agents get highest priority."
+    },
+    "timeouts": {
+        "development_agent_timeout": 600.0,
+        "production_agent_timeout": 300.0,
+        "note": "Development agents get longer timeout for testing/iteration"
+    },
+    "retry_config": {
+        "development_max_retries": 3,
+        "production_max_retries": 5,
+        "note": "Fewer retries for development (faster iteration)"
+    },
+    "resource_strategy": {
+        "strategy": "RESERVE_50_PERCENT",
+        "total_workers": 8,
+        "development_allocation": 4,
+        "production_allocation": 4,
+        "note": "Reserve 50% of resources for development work"
+    },
+    "environment_variables": {
+        "MAX_CONCURRENT_AGENTS": "4",
+        "AGENT_TIMEOUT": "600.0",
+        "AGENT_MAX_RETRIES": "3",
+        "note": "Set these environment variables to apply development limits"
+    },
+    "usage_instructions": {
+        "step_1": "Set environment variables: export MAX_CONCURRENT_AGENTS=4",
+        "step_2": "Use AgentSpawner with agent_types=['Intelligence'] filter",
+        "step_3": "Set priority=10 for development agents",
+        "step_4": "Monitor resource usage via executor.get_execution_statistics()"
+    }
+}
+
 
 def create_development_config() -> Dict[str, Any]:
     """
     Create development resource allocation configuration.
     
+    Nested sections are shared with _CONFIG_TEMPLATE and must not be
+    mutated by callers.
+    
     Returns:
         Configuration dictionary
     """
-    config = {
+    return {
+        **_CONFIG_TEMPLATE,
         "_meta": {
-            "config_type": "DEVELOPMENT_RESOURCE_ALLOCATION",
-            "generated_at": datetime.now(timezone.utc).isoformat(),
-            "purpose": "Development-specific agent resource allocation settings",
-            "read_only": False,
-            "authoritative": False
-        },
-        "execution_limits": {
-            "max_concurrent_agents": 4,
-            "development_workers": 4,
-            "production_workers": 2,
-            "note": "Reserve 4 workers for development, 2 for production"
-        },
-        "agent_type_allocation": {
-            "intelligence_workers": 4,
-            "drafting_workers": 2,
-            "execution_workers": 1,
-            "learning_workers": 1,
-            "note": "Allocate more resources to Intelligence agents (read-only, safe for development)"
-        },
-        "priority_levels": {
-            "development_priority": 10,
-            "production_priority": 1,
-            "testing_priority": 5,
-            "note": "Higher priority = executed first. Development agents get highest priority."
-        },
-        "timeouts": {
-            "development_agent_timeout": 600.0,
-            "production_agent_timeout": 300.0,
-            "note": "Development agents get longer timeout for testing/iteration"
-        },
-        "retry_config": {
-            "development_max_retries": 3,
-            "production_max_retries": 5,
-            "note": "Fewer retries for development (faster iteration)"
-        },
-        "resource_strategy": {
-            "strategy": "RESERVE_50_PERCENT",
-            "total_workers": 8,
-            "development_allocation": 4,
-            "production_allocation": 4,
-            "note": "Reserve 50% of resources for development work"
-        },
-        "environment_variables": {
-            "MAX_CONCURRENT_AGENTS": "4",
-            "AGENT_TIMEOUT": "600.0",
-            "AGENT_MAX_RETRIES": "3",
-            "note": "Set these environment variables to apply development limits"
-        },
-        "usage_instructions": {
-            "step_1": "Set environment variables: export MAX_CONCURRENT_AGENTS=4",
-            "step_2": "Use AgentSpawner with agent_types=['Intelligence'] filter",
-            "step_3": "Set priority=10 for development agents",
-            "step_4": "Monitor resource usage via executor.get_execution_statistics()"
+            **_CONFIG_TEMPLATE["_meta"],
+            "generated_at": datetime.now(timezone.utc).isoformat()
         }
     }
-    
-    return config
 
 
 def save_development_config(config: Dict[str, Any]) -> Path:
@@ -109,8 +125,11 @@ def save_development_config(config: Dict[str, Any]) -> Path:
     Returns:
         Path to saved configuration file
     """
-    with open(DEV_CONFIG_PATH, 'w', encoding='utf-8') as f:
-        json.dump(config, f, indent=2, ensure_ascii=False)
+    if ORJSON_AVAILABLE:
+        DEV_CONFIG_PATH.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    else:
+        with open(DEV_CONFIG_PATH, 'w', encoding='utf-8') as f:
+            json.dump(config, f, indent=2, ensure_ascii=False)
     
     return DEV_CONFIG_PATH
 
@@ -177,9 +196,8 @@ def main():
         return 0
         
     except Exception as e:
-        print(f"[ERROR] {e}", file=sys.stderr)
         import traceback
-        traceback.print_exc()
+        sys.stderr.write(f"[ERROR] {e}\n" + "".join(traceback.format_exception(e)))
         return 1
 
 
@@ -16,10 +16,23 @@ Schema:
 
 import json
 import sys
+from collections import Counter
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Dict, Any, List
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # Path setup
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
@@ -29,14 +42,21 @@ BASE_DIR = PROJECT_ROOT
 REGISTRY_PATH = BASE_DIR / "registry" / "agent-registry.json"
 STATE_PATH = BASE_DIR / "state" / "legislative-state.json"
 
+# Registries larger than this are streamed with ijson instead of parsed whole
+STREAMING_THRESHOLD_BYTES = 5_000_000
+
+# Histogram bars for the breakdown sections, indexed by capped count
+_BAR_WIDTH = 20
+_BARS = tuple("#" * i for i in range(_BAR_WIDTH + 1))
+
 
 def load_registry() -> Dict[str, Any]:
     """Load agent registry."""
     if not REGISTRY_PATH.exists():
         return {"agents": [], "_meta": {}}
     
-    with open(REGISTRY_PATH, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    data = REGISTRY_PATH.read_bytes()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
 
 
 def load_state() -> Dict[str, Any]:
@@ -44,8 +64,8 @@ def load_state() -> Dict[str, Any]:
     if not STATE_PATH.exists():
         return {}
     
-    with open(STATE_PATH, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    data = STATE_PATH.read_bytes()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
 
 
 def analyze_resource_usage(registry: Dict[str, Any]) -> Dict[str, Any]:
@@ -61,33 +81,83 @@ def analyze_resource_usage(registry: Dict[str, Any]) -> Dict[str, Any]:
     agents = registry.get("agents", [])
     meta = registry.get("_meta", {})
     
-    # Count by status
-    status_counts = {}
-    type_counts = {}
+    # Count by status and type (materialized columns let Counter tally in C)
+    status_counts = Counter([agent.get("status", "UNKNOWN") for agent in agents])
+    type_counts = Counter([agent.get("agent_type", "UNKNOWN") for agent in agents])
+    
+    # Categorize by development vs production
     development_agents = []
     production_agents = []
     
     for agent in agents:
-        status = agent.get("status", "UNKNOWN")
-        agent_type = agent.get("agent_type", "UNKNOWN")
         agent_id = agent.get("agent_id", "unknown")
         metadata = agent.get("metadata", {})
         
-        # Count by status
-        status_counts[status] = status_counts.get(status, 0) + 1
-        
-        # Count by type
-        type_counts[agent_type] = type_counts.get(agent_type, 0) + 1
-        
-        # Categorize by development vs production
         if metadata.get("development_mode") or metadata.get("development"):
             development_agents.append(agent_id)
         else:
             production_agents.append(agent_id)
     
+    return _build_analysis(
+        len(agents), status_counts, type_counts,
+        development_agents, production_agents, meta
+    )
+
+
+def analyze_resource_usage_streaming(registry_path: Path) -> Dict[str, Any]:
+    """
+    Analyze agent resource usage by streaming the registry file.
+    
+    Agents are parsed one at a time with ijson, so memory stays flat
+    regardless of registry size. Used for registries above
+    STREAMING_THRESHOLD_BYTES.
+    
+    Args:
+        registry_path: Path to agent-registry.json
+        
+    Returns:
+        Resource usage analysis (same shape as analyze_resource_usage)
+    """
+    status_counts = Counter()
+    type_counts = Counter()
+    development_agents = []
+    production_agents = []
+    total_count = 0
+    
+    with open(registry_path, 'rb') as f:
+        for agent in ijson.items(f, 'agents.item', use_float=True):
+            total_count += 1
+            status_counts[agent.get("status", "UNKNOWN")] += 1
+            type_counts[agent.get("agent_type", "UNKNOWN")] += 1
+            
+            agent_id = agent.get("agent_id", "unknown")
+            metadata = agent.get("metadata", {})
+            
+            if metadata.get("development_mode") or metadata.get("development"):
+                development_agents.append(agent_id)
+            else:
+                production_agents.append(agent_id)
+    
+    with open(registry_path, 'rb') as f:
+        meta = next(ijson.items(f, '_meta', use_float=True), {})
+    
+    return _build_analysis(
+        total_count, status_counts, type_counts,
+        development_agents, production_agents, meta
+    )
+
+
+def _build_analysis(
+    total_count: int,
+    status_counts: Counter,
+    type_counts: Counter,
+    development_agents: List[str],
+    production_agents: List[str],
+    meta: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Assemble the resource usage analysis from aggregated counts."""
     # Calculate resource utilization
     active_count = status_counts.get("RUNNING", 0) + status_counts.get("IDLE", 0)
-    total_count = len(agents)
     utilization = (active_count / total_count * 100) if total_count > 0 else 0
     
     return {
@@ -104,87 +174,92 @@ def analyze_resource_usage(registry: Dict[str, Any]) -> Dict[str, Any]:
 
 def display_resource_report(analysis: Dict[str, Any], state: Dict[str, Any]) -> None:
     """Display resource usage report."""
-    print("=" * 70)
-    print("AGENT RESOURCE USAGE REPORT")
-    print("=" * 70)
-    print()
+    out: List[str] = []
+    
+    out.append("=" * 70)
+    out.append("AGENT RESOURCE USAGE REPORT")
+    out.append("=" * 70)
+    out.append("")
     
     # System state
     current_state = state.get("current_state", "UNKNOWN")
-    print(f"Current Legislative State: {current_state}")
-    print()
+    out.append(f"Current Legislative State: {current_state}")
+    out.append("")
     
     # Resource summary
-    print("Resource Summary:")
-    print("-" * 70)
-    print(f"Total Agents: {analysis['total_agents']}")
-    print(f"Active Agents: {analysis['active_agents']}")
-    print(f"Resource Utilization: {analysis['utilization_percent']}%")
-    print()
+    out.append("Resource Summary:")
+    out.append("-" * 70)
+    out.append(f"Total Agents: {analysis['total_agents']}")
+    out.append(f"Active Agents: {analysis['active_agents']}")
+    out.append(f"Resource Utilization: {analysis['utilization_percent']}%")
+    out.append("")
     
     # Status breakdown
-    print("Status Breakdown:")
-    print("-" * 70)
+    out.append("Status Breakdown:")
+    out.append("-" * 70)
     for status, count in sorted(analysis['status_breakdown'].items()):
-        bar = "#" * min(count, 20)
-        print(f"  {status:20s} {count:3d} {bar}")
-    print()
+        bar = _BARS[min(count, _BAR_WIDTH)]
+        out.append(f"  {status:20s} {count:3d} {bar}")
+    out.append("")
     
     # Type breakdown
-    print("Agent Type Breakdown:")
-    print("-" * 70)
+    out.append("Agent Type Breakdown:")
+    out.append("-" * 70)
     for agent_type, count in sorted(analysis['type_breakdown'].items()):
-        bar = "#" * min(count, 20)
-        print(f"  {agent_type:20s} {count:3d} {bar}")
-    print()
+        bar = _BARS[min(count, _BAR_WIDTH)]
+        out.append(f"  {agent_type:20s} {count:3d} {bar}")
+    out.append("")
     
     # Development vs Production
-    print("Development vs Production:")
-    print("-" * 70)
-    print(f"  Development Agents: {len(analysis['development_agents'])}")
+    out.append("Development vs Production:")
+    out.append("-" * 70)
+    out.append(f"  Development Agents: {len(analysis['development_agents'])}")
     if analysis['development_agents']:
         for agent_id in analysis['development_agents']:
-            print(f"    - {agent_id}")
-    print()
-    print(f"  Production Agents: {len(analysis['production_agents'])}")
+            out.append(f"    - {agent_id}")
+    out.append("")
+    out.append(f"  Production Agents: {len(analysis['production_agents'])}")
     if len(analysis['production_agents']) > 5:
-        print(f"    (Showing first 5 of {len(analysis['production_agents'])})")
+        out.append(f"    (Showing first 5 of {len(analysis['production_agents'])})")
         for agent_id in analysis['production_agents'][:5]:
-            print(f"    - {agent_id}")
+            out.append(f"    - {agent_id}")
     else:
         for agent_id in analysis['production_agents']:
-            print(f"    - {agent_id}")
-    print()
+            out.append(f"    - {agent_id}")
+    out.append("")
     
     # Recommendations
-    print("Resource Allocation Recommendations:")
-    print("-" * 70)
+    out.append("Resource Allocation Recommendations:")
+    out.append("-" * 70)
     
     if analysis['active_agents'] == 0:
-        print("  [OK] No active agents - resources available for development")
+        out.append("  [OK] No active agents - resources available for development")
     elif analysis['active_agents'] < 3:
-        print("  [OK] Low resource usage - can spawn development agents")
+        out.append("  [OK] Low resource usage - can spawn development agents")
     elif analysis['active_agents'] < 6:
-        print("  [WARN] Moderate resource usage - consider limiting concurrent agents")
+        out.append("  [WARN] Moderate resource usage - consider limiting concurrent agents")
     else:
-        print("  [HIGH] High resource usage - wait for agents to complete or increase limits")
+        out.append("  [HIGH] High resource usage - wait for agents to complete or increase limits")
     
     if len(analysis['development_agents']) == 0:
-        print("  [TIP] No development agents active - use dev__spawn_intelligence_agents.py")
+        out.append("  [TIP] No development agents active - use dev__spawn_intelligence_agents.py")
     
-    print()
-    print("=" * 70)
+    out.append("")
+    out.append("=" * 70)
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
     """Main execution."""
     try:
-        # Load data
-        registry = load_registry()
+        # Load and analyze (stream very large registries when ijson is available)
         state = load_state()
-        
-        # Analyze
-        analysis = analyze_resource_usage(registry)
+        if (IJSON_AVAILABLE and REGISTRY_PATH.exists()
+                and REGISTRY_PATH.stat().st_size > STREAMING_THRESHOLD_BYTES):
+            analysis = analyze_resource_usage_streaming(REGISTRY_PATH)
+        else:
+            analysis = analyze_resource_usage(load_registry())
         
         # Display report
         display_resource_report(analysis, state)
@@ -192,9 +267,8 @@ def main():
         return 0
         
     except Exception as e:
-        print(f"[ERROR] {e}", file=sys.stderr)
         import traceback
-        traceback.print_exc()
+        sys.stderr.write(f"[ERROR] {e}\n" + "".join(traceback.format_exception(e)))
         return 1
 
 
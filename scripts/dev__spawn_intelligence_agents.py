@@ -16,36 +16,56 @@ Schema:
 
 import json
 import sys
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, NoReturn, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Path setup
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-try:
-    from app.agent_spawner import AgentSpawner
-    from app.models import LegislativeState
-    from app.agent_client import AgentClient
-except ImportError as e:
-    print(f"ERROR: Failed to import required modules: {e}")
-    print("Make sure you're running from the agent-orchestrator directory")
-    sys.exit(1)
-
 # Constants
 BASE_DIR = PROJECT_ROOT
 STATE_PATH = BASE_DIR / "state" / "legislative-state.json"
 REGISTRY_PATH = BASE_DIR / "registry" / "agent-registry.json"
 
+# Agent ID prefix -> (agent_type, risk_level)
+_AGENT_TYPE_BY_PREFIX = {
+    "intel": ("Intelligence", "LOW"),
+    "draft": ("Drafting", "MEDIUM"),
+    "execution": ("Execution", "HIGH")
+}
+_DEFAULT_AGENT_TYPE = ("Intelligence", "LOW")
+
+
+def _exit_on_import_error(error: ImportError) -> NoReturn:
+    """Report a missing app module and exit."""
+    print(f"ERROR: Failed to import required modules: {error}")
+    print("Make sure you're running from the agent-orchestrator directory")
+    sys.exit(1)
+
 
+@lru_cache(maxsize=1)
 def load_workflow_state() -> Dict[str, Any]:
-    """Load current workflow state."""
+    """
+    Load current workflow state.
+    
+    The parsed state is cached for the lifetime of the process so that
+    get_workflow_id() and get_current_state() share a single parse.
+    Call load_workflow_state.cache_clear() if the file may have changed.
+    """
     if not STATE_PATH.exists():
         raise FileNotFoundError(f"State file not found: {STATE_PATH}")
     
-    with open(STATE_PATH, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    data = STATE_PATH.read_bytes()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
 
 
 def get_workflow_id() -> str:
@@ -78,6 +98,13 @@ def spawn_intelligence_agents_for_development(
     Returns:
         List of spawn results
     """
+    # Imported lazily so no-op paths don't pay for the app package import
+    try:
+        from app.agent_spawner import AgentSpawner
+        from app.models import LegislativeState
+    except ImportError as e:
+        _exit_on_import_error(e)
+    
     print(f"[DEV] Spawning Intelligence agents for development...")
     print(f"[DEV] Workflow: {workflow_id}")
     print(f"[DEV] State: {legislative_state}")
@@ -135,25 +162,21 @@ def spawn_specific_development_agent(
     Returns:
         Spawn result or None
     """
+    try:
+        from app.agent_spawner import AgentSpawner
+    except ImportError as e:
+        _exit_on_import_error(e)
+    
     print(f"[DEV] Spawning specific agent: {agent_id}")
     print(f"[DEV] Priority: {priority}")
     print()
     
     spawner = AgentSpawner(workflow_id=workflow_id)
     
-    # Determine agent type from agent_id
-    if agent_id.startswith("intel_"):
-        agent_type = "Intelligence"
-        risk_level = "LOW"
-    elif agent_id.startswith("draft_"):
-        agent_type = "Drafting"
-        risk_level = "MEDIUM"
-    elif agent_id.startswith("execution_"):
-        agent_type = "Execution"
-        risk_level = "HIGH"
-    else:
-        agent_type = "Intelligence"
-        risk_level = "LOW"
+    # Determine agent type from the "<prefix>_" part of agent_id; ids
+    # without an underscore have no prefix and get the default
+    prefix, sep, _ = agent_id.partition("_")
+    agent_type, risk_level = _AGENT_TYPE_BY_PREFIX.get(prefix, _DEFAULT_AGENT_TYPE) if sep else _DEFAULT_AGENT_TYPE
     
     result = spawner.spawn_agent(
         agent_id=agent_id,
@@ -178,10 +201,7 @@ def spawn_specific_development_agent(
 
 def main():
     """Main execution."""
-    print("=" * 60)
-    print("Development Agent Spawner - Intelligence Agents Only")
-    print("=" * 60)
-    print()
+    sys.stdout.write("=" * 60 + "\nDevelopment Agent Spawner - Intelligence Agents Only\n" + "=" * 60 + "\n\n")
     
     try:
         # Load workflow state
@@ -200,21 +220,22 @@ def main():
             priority=10   # High priority for development
         )
         
-        print()
-        print("=" * 60)
-        print("Development agent spawning complete")
-        print("=" * 60)
-        print()
-        print("Note: These agents are spawned for development work only.")
-        print("They are read-only Intelligence agents and will not modify")
-        print("system state or trigger execution.")
+        sys.stdout.write("\n".join([
+            "",
+            "=" * 60,
+            "Development agent spawning complete",
+            "=" * 60,
+            "",
+            "Note: These agents are spawned for development work only.",
+            "They are read-only Intelligence agents and will not modify",
+            "system state or trigger execution.",
+        ]) + "\n")
         
         return 0
         
     except Exception as e:
-        print(f"[ERROR] {e}", file=sys.stderr)
         import traceback
-        traceback.print_exc()
+        sys.stderr.write(f"[ERROR] {e}\n" + "".join(traceback.format_exception(e)))
         return 1
 
 
@@ -15,15 +15,27 @@ Schema:
 - N/A (dashboard script)
 """
 
-import json
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 # Path setup
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from _json_cache import get_json, open_maybe_gz
 
 # Constants
 BASE_DIR = PROJECT_ROOT
@@ -31,36 +43,95 @@ STATE_PATH = BASE_DIR / "state" / "legislative-state.json"
 REGISTRY_PATH = BASE_DIR / "registry" / "agent-registry.json"
 DEV_CONFIG_PATH = BASE_DIR / "config" / "development_config.json"
 
+# Agent statuses that count as consuming resources
+_ACTIVE_STATES = frozenset({"RUNNING", "IDLE"})
+
+_UTC = timezone.utc
+
+# Row template shared by the ACTIVE and DEVELOPMENT agent sections
+_AGENT_LINE = "  [{:12s}] {:40s} ({})".format
+
+# Histogram bars for the breakdown sections, indexed by capped count
+_BARS = tuple("#" * i for i in range(31))
+
+# Registries below this size are parsed up front to detect the empty case
+_SMALL_REGISTRY_BYTES = 64
+
+
+@dataclass(slots=True, frozen=True)
+class AgentRow:
+    """Lightweight per-agent record used while rendering the dashboard."""
+    id: str
+    status: str
+    type: str
+    heartbeat: str
+
 
 def load_state() -> Dict[str, Any]:
     """Load legislative state."""
     if not STATE_PATH.exists():
         return {}
-    with open(STATE_PATH, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return get_json(STATE_PATH)
 
 
 def load_registry() -> Dict[str, Any]:
     """Load agent registry."""
     if not REGISTRY_PATH.exists():
         return {"agents": [], "_meta": {}}
-    with open(REGISTRY_PATH, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return get_json(REGISTRY_PATH)
+
+
+def iter_agents() -> Iterator[Dict[str, Any]]:
+    """
+    Yield registry agents one at a time.
+    
+    With ijson installed the registry is streamed (memory-mapped, or
+    decompressed on the fly if gzipped), so only one agent record is
+    materialized at a time. Otherwise falls back to load_registry().
+    """
+    if not IJSON_AVAILABLE:
+        yield from load_registry().get("agents", [])
+        return
+    if not REGISTRY_PATH.exists():
+        return
+    with open_maybe_gz(REGISTRY_PATH) as f:
+        yield from ijson.items(f, 'agents.item', use_float=True)
+
+
+def registry_is_empty() -> bool:
+    """
+    Return True if the registry is missing or lists no agents.
+    
+    Decided from stat() alone for anything but tiny files, so a populated
+    registry is never parsed here.
+    """
+    if not REGISTRY_PATH.exists():
+        return True
+    if REGISTRY_PATH.stat().st_size >= _SMALL_REGISTRY_BYTES:
+        return False
+    return not load_registry().get("agents")
 
 
 def load_dev_config() -> Optional[Dict[str, Any]]:
     """Load development configuration."""
     if not DEV_CONFIG_PATH.exists():
         return None
-    with open(DEV_CONFIG_PATH, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return get_json(DEV_CONFIG_PATH)
 
 
-def format_timestamp(timestamp_str: str) -> str:
-    """Format ISO timestamp to readable string."""
+@lru_cache(maxsize=2048)
+def _format_ts(timestamp_str: str, now_epoch: int) -> str:
+    """
+    Format ISO timestamp relative to now_epoch (whole seconds, UTC).
+    
+    Cached: callers pass the same bucketed "now" for a whole render, so
+    agents sharing a heartbeat are only parsed once.
+    """
+    if not timestamp_str:
+        return "N/A"
     try:
-        dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-        now = datetime.now(timezone.utc)
+        dt = datetime.fromisoformat(timestamp_str)
+        now = datetime.fromtimestamp(now_epoch, _UTC)
         delta = now - dt
         
         if delta < timedelta(minutes=1):
@@ -71,158 +142,190 @@ def format_timestamp(timestamp_str: str) -> str:
             return f"{delta.seconds // 3600}h ago"
         else:
             return f"{delta.days}d ago"
-    except:
+    except (ValueError, TypeError):
+        # Unparseable, or naive timestamp that can't be compared to UTC
         return timestamp_str
 
 
-def display_dashboard(state: Dict[str, Any], registry: Dict[str, Any], config: Optional[Dict[str, Any]]) -> None:
-    """Display development status dashboard."""
-    print("=" * 80)
-    print("DEVELOPMENT STATUS DASHBOARD".center(80))
-    print("=" * 80)
-    print()
+def display_dashboard(state: Dict[str, Any], agents: Iterable[Dict[str, Any]], config: Optional[Dict[str, Any]]) -> None:
+    """
+    Display development status dashboard.
+    
+    Args:
+        state: Legislative state
+        agents: Registry agents (any iterable, e.g. iter_agents()); consumed once
+        config: Development config, if present
+    """
+    out: List[str] = []
+    try:
+        _append_header(out, state, config)
+        
+        # Agent Statistics (single pass, so agents may be a stream)
+        total = 0
+        status_counts = Counter()
+        type_counts = Counter()
+        development_agents = []
+        production_agents = []
+        active_agents = []
+        
+        for agent in agents:
+            total += 1
+            status = agent.get("status", "UNKNOWN")
+            agent_type = agent.get("agent_type", "UNKNOWN")
+            agent_id = agent.get("agent_id", "unknown")
+            metadata = agent.get("metadata", {})
+            row = AgentRow(agent_id, status, agent_type, agent.get("last_heartbeat", ""))
+            
+            status_counts[status] += 1
+            type_counts[agent_type] += 1
+            
+            if metadata.get("development_mode") or metadata.get("development"):
+                development_agents.append(row)
+            else:
+                production_agents.append(row)
+            
+            if status in _ACTIVE_STATES:
+                active_agents.append(row)
+        
+        active_count = len(active_agents)
+        utilization = (active_count / total * 100) if total > 0 else 0
+        
+        out.append("AGENT STATISTICS")
+        out.append("-" * 80)
+        out.append(f"  Total Agents: {total}")
+        out.append(f"  Active Agents: {active_count} ({utilization:.1f}% utilization)")
+        out.append(f"  Development Agents: {len(development_agents)}")
+        out.append(f"  Production Agents: {len(production_agents)}")
+        out.append("")
+        
+        # Status Breakdown (skipped entirely for an empty registry)
+        if status_counts:
+            out.append("STATUS BREAKDOWN")
+            out.append("-" * 80)
+            for status, count in status_counts.most_common():
+                bar = _BARS[min(count, 30)]
+                out.append(f"  {status:20s} {count:3d} {bar}")
+            out.append("")
+        
+        # Type Breakdown
+        if type_counts:
+            out.append("TYPE BREAKDOWN")
+            out.append("-" * 80)
+            for agent_type, count in type_counts.most_common():
+                bar = _BARS[min(count, 30)]
+                out.append(f"  {agent_type:20s} {count:3d} {bar}")
+            out.append("")
+        
+        # One "now" per render so _format_ts cache hits are real
+        now_bucket = int(datetime.now(_UTC).timestamp())
+        
+        # Active Agents
+        if active_agents:
+            out.append("ACTIVE AGENTS")
+            out.append("-" * 80)
+            for agent in active_agents[:10]:  # Show first 10
+                heartbeat_str = _format_ts(agent.heartbeat, now_bucket) if agent.heartbeat else "N/A"
+                out.append(_AGENT_LINE(agent.status, agent.id, heartbeat_str))
+            if len(active_agents) > 10:
+                out.append(f"  ... and {len(active_agents) - 10} more")
+            out.append("")
+        
+        # Development Agents
+        if development_agents:
+            out.append("DEVELOPMENT AGENTS")
+            out.append("-" * 80)
+            for agent in development_agents:
+                heartbeat_str = _format_ts(agent.heartbeat, now_bucket) if agent.heartbeat else "N/A"
+                out.append(_AGENT_LINE(agent.status, agent.id, heartbeat_str))
+            out.append("")
+        
+        _append_footer(out, active_count, len(development_agents))
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
+
+
+def _render_empty_dashboard(state: Dict[str, Any], config: Optional[Dict[str, Any]]) -> None:
+    """Display the dashboard for a registry with no agents, skipping all aggregation."""
+    out: List[str] = []
+    try:
+        _append_header(out, state, config)
+        out.append("AGENT STATISTICS")
+        out.append("-" * 80)
+        out.append("  Total Agents: 0")
+        out.append("  Active Agents: 0 (0.0% utilization)")
+        out.append("  Development Agents: 0")
+        out.append("  Production Agents: 0")
+        out.append("")
+        _append_footer(out, 0, 0)
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
+
+
+def _append_header(out: List[str], state: Dict[str, Any], config: Optional[Dict[str, Any]]) -> None:
+    """Append the banner, SYSTEM STATE and RESOURCE CONFIGURATION sections."""
+    out.append("=" * 80)
+    out.append("DEVELOPMENT STATUS DASHBOARD".center(80))
+    out.append("=" * 80)
+    out.append("")
     
     # System State
-    print("SYSTEM STATE")
-    print("-" * 80)
+    out.append("SYSTEM STATE")
+    out.append("-" * 80)
     current_state = state.get("current_state", "UNKNOWN")
     workflow_id = state.get("_meta", {}).get("workflow_id", "unknown")
-    print(f"  Legislative State: {current_state}")
-    print(f"  Workflow ID: {workflow_id}")
-    print()
+    out.append(f"  Legislative State: {current_state}")
+    out.append(f"  Workflow ID: {workflow_id}")
+    out.append("")
     
     # Resource Configuration
-    print("RESOURCE CONFIGURATION")
-    print("-" * 80)
+    out.append("RESOURCE CONFIGURATION")
+    out.append("-" * 80)
     if config:
         limits = config.get("execution_limits", {})
-        print(f"  Max Concurrent Agents: {limits.get('max_concurrent_agents', 'N/A')}")
-        print(f"  Development Workers: {limits.get('development_workers', 'N/A')}")
-        print(f"  Production Workers: {limits.get('production_workers', 'N/A')}")
+        out.append(f"  Max Concurrent Agents: {limits.get('max_concurrent_agents', 'N/A')}")
+        out.append(f"  Development Workers: {limits.get('development_workers', 'N/A')}")
+        out.append(f"  Production Workers: {limits.get('production_workers', 'N/A')}")
     else:
-        print("  [INFO] No development config found - using defaults")
-    print()
-    
-    # Agent Statistics
-    agents = registry.get("agents", [])
-    meta = registry.get("_meta", {})
-    
-    status_counts = {}
-    type_counts = {}
-    development_agents = []
-    production_agents = []
-    active_agents = []
-    
-    for agent in agents:
-        status = agent.get("status", "UNKNOWN")
-        agent_type = agent.get("agent_type", "UNKNOWN")
-        agent_id = agent.get("agent_id", "unknown")
-        metadata = agent.get("metadata", {})
-        last_heartbeat = agent.get("last_heartbeat", "")
-        
-        status_counts[status] = status_counts.get(status, 0) + 1
-        type_counts[agent_type] = type_counts.get(agent_type, 0) + 1
-        
-        if metadata.get("development_mode") or metadata.get("development"):
-            development_agents.append({
-                "id": agent_id,
-                "status": status,
-                "type": agent_type,
-                "heartbeat": last_heartbeat
-            })
-        else:
-            production_agents.append({
-                "id": agent_id,
-                "status": status,
-                "type": agent_type,
-                "heartbeat": last_heartbeat
-            })
-        
-        if status in ["RUNNING", "IDLE"]:
-            active_agents.append({
-                "id": agent_id,
-                "status": status,
-                "type": agent_type,
-                "heartbeat": last_heartbeat
-            })
-    
-    total = len(agents)
-    active_count = len(active_agents)
-    utilization = (active_count / total * 100) if total > 0 else 0
-    
-    print("AGENT STATISTICS")
-    print("-" * 80)
-    print(f"  Total Agents: {total}")
-    print(f"  Active Agents: {active_count} ({utilization:.1f}% utilization)")
-    print(f"  Development Agents: {len(development_agents)}")
-    print(f"  Production Agents: {len(production_agents)}")
-    print()
-    
-    # Status Breakdown
-    print("STATUS BREAKDOWN")
-    print("-" * 80)
-    for status, count in sorted(status_counts.items()):
-        bar = "#" * min(count, 30)
-        print(f"  {status:20s} {count:3d} {bar}")
-    print()
-    
-    # Type Breakdown
-    print("TYPE BREAKDOWN")
-    print("-" * 80)
-    for agent_type, count in sorted(type_counts.items()):
-        bar = "#" * min(count, 30)
-        print(f"  {agent_type:20s} {count:3d} {bar}")
-    print()
-    
-    # Active Agents
-    if active_agents:
-        print("ACTIVE AGENTS")
-        print("-" * 80)
-        for agent in active_agents[:10]:  # Show first 10
-            heartbeat_str = format_timestamp(agent["heartbeat"]) if agent["heartbeat"] else "N/A"
-            print(f"  [{agent['status']:12s}] {agent['id']:40s} ({heartbeat_str})")
-        if len(active_agents) > 10:
-            print(f"  ... and {len(active_agents) - 10} more")
-        print()
-    
-    # Development Agents
-    if development_agents:
-        print("DEVELOPMENT AGENTS")
-        print("-" * 80)
-        for agent in development_agents:
-            heartbeat_str = format_timestamp(agent["heartbeat"]) if agent["heartbeat"] else "N/A"
-            print(f"  [{agent['status']:12s}] {agent['id']:40s} ({heartbeat_str})")
-        print()
-    
-    # Recommendations
-    print("RECOMMENDATIONS")
-    print("-" * 80)
+        out.append("  [INFO] No development config found - using defaults")
+    out.append("")
+
+
+def _append_footer(out: List[str], active_count: int, development_count: int) -> None:
+    """Append the RECOMMENDATIONS section and the closing banner."""
+    out.append("RECOMMENDATIONS")
+    out.append("-" * 80)
     if active_count == 0:
-        print("  [OK] No active agents - resources fully available for development")
+        out.append("  [OK] No active agents - resources fully available for development")
     elif active_count < 3:
-        print("  [OK] Low resource usage - can spawn development agents")
+        out.append("  [OK] Low resource usage - can spawn development agents")
     elif active_count < 6:
-        print("  [WARN] Moderate resource usage - consider limiting concurrent agents")
+        out.append("  [WARN] Moderate resource usage - consider limiting concurrent agents")
     else:
-        print("  [HIGH] High resource usage - wait for agents to complete or increase limits")
+        out.append("  [HIGH] High resource usage - wait for agents to complete or increase limits")
     
-    if len(development_agents) == 0:
-        print("  [TIP] No development agents active - use dev__spawn_intelligence_agents.py")
+    if development_count == 0:
+        out.append("  [TIP] No development agents active - use dev__spawn_intelligence_agents.py")
     
-    print()
-    print("=" * 80)
-    print(f"Dashboard generated at: {datetime.now(timezone.utc).isoformat()}")
-    print("=" * 80)
+    out.append("")
+    out.append("=" * 80)
+    out.append(f"Dashboard generated at: {datetime.now(_UTC).isoformat()}")
+    out.append("=" * 80)
 
 
 def main():
     """Main dashboard."""
     try:
-        state = load_state()
-        registry = load_registry()
-        config = load_dev_config()
+        # Independent reads; the registry itself is streamed by iter_agents()
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            state_future = pool.submit(load_state)
+            config_future = pool.submit(load_dev_config)
+            state = state_future.result()
+            config = config_future.result()
         
-        display_dashboard(state, registry, config)
+        if registry_is_empty():
+            _render_empty_dashboard(state, config)
+        else:
+            display_dashboard(state, iter_agents(), config)
         
         return 0
         
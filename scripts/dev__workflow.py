@@ -15,16 +15,27 @@ Schema:
 - N/A (workflow execution script)
 """
 
-import json
 import sys
 import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 # Path setup
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from _json_cache import get_json, open_maybe_gz
 
 try:
     from app.agent_spawner import AgentSpawner
@@ -33,61 +44,101 @@ except ImportError as e:
     print(f"[ERROR] Failed to import required modules: {e}")
     sys.exit(1)
 
+# State string -> enum, built once at import
+_STATE_MAP = MappingProxyType({
+    "PRE_EVT": LegislativeState.PRE_EVT,
+    "INTRO_EVT": LegislativeState.INTRO_EVT,
+    "COMM_EVT": LegislativeState.COMM_EVT,
+    "FLOOR_EVT": LegislativeState.FLOOR_EVT,
+    "FINAL_EVT": LegislativeState.FINAL_EVT,
+    "IMPL_EVT": LegislativeState.IMPL_EVT
+})
+
 # Constants
 BASE_DIR = PROJECT_ROOT
 STATE_PATH = BASE_DIR / "state" / "legislative-state.json"
 REGISTRY_PATH = BASE_DIR / "registry" / "agent-registry.json"
 DEV_CONFIG_PATH = BASE_DIR / "config" / "development_config.json"
 
+# Agent statuses that count as consuming resources
+_ACTIVE_STATES = frozenset({"RUNNING", "IDLE"})
+
 
 def load_state() -> Dict[str, Any]:
     """Load legislative state."""
     if not STATE_PATH.exists():
         raise FileNotFoundError(f"State file not found: {STATE_PATH}")
-    with open(STATE_PATH, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return get_json(STATE_PATH)
 
 
 def load_registry() -> Dict[str, Any]:
     """Load agent registry."""
     if not REGISTRY_PATH.exists():
         return {"agents": [], "_meta": {}}
-    with open(REGISTRY_PATH, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return get_json(REGISTRY_PATH)
 
 
 def load_dev_config() -> Optional[Dict[str, Any]]:
     """Load development configuration."""
     if not DEV_CONFIG_PATH.exists():
         return None
-    with open(DEV_CONFIG_PATH, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return get_json(DEV_CONFIG_PATH)
 
 
 def analyze_resources(registry: Dict[str, Any]) -> Dict[str, Any]:
-    """Analyze current resource usage."""
-    agents = registry.get("agents", [])
+    """Analyze current resource usage for an already-loaded registry."""
+    return _tally_agents(registry.get("agents", []))
+
+
+def analyze_resources_streaming(registry_path: Path) -> Dict[str, Any]:
+    """
+    Analyze current resource usage by streaming the registry file.
     
-    status_counts = {}
-    type_counts = {}
+    The file is memory-mapped (or decompressed on the fly if gzipped) and
+    agents are parsed one at a time with ijson, so the agent list is never
+    materialized.
+    
+    Args:
+        registry_path: Path to agent-registry.json (must exist)
+        
+    Returns:
+        Resource usage analysis (same shape as analyze_resources)
+    """
+    with open_maybe_gz(registry_path) as f:
+        return _tally_agents(ijson.items(f, 'agents.item', use_float=True))
+
+
+def analyze_registry() -> Dict[str, Any]:
+    """Analyze the on-disk registry, streaming it when ijson is available."""
+    if IJSON_AVAILABLE and REGISTRY_PATH.exists():
+        return analyze_resources_streaming(REGISTRY_PATH)
+    return analyze_resources(load_registry())
+
+
+def _tally_agents(agents: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Single-pass resource tally over any agent iterable."""
+    status_counts = Counter()
+    type_counts = Counter()
+    total = 0
     active_count = 0
     development_count = 0
     
+    # Totals are tallied in-loop so agents may be a stream
     for agent in agents:
+        total += 1
         status = agent.get("status", "UNKNOWN")
         agent_type = agent.get("agent_type", "UNKNOWN")
         metadata = agent.get("metadata", {})
         
-        status_counts[status] = status_counts.get(status, 0) + 1
-        type_counts[agent_type] = type_counts.get(agent_type, 0) + 1
+        status_counts[status] += 1
+        type_counts[agent_type] += 1
         
-        if status in ["RUNNING", "IDLE"]:
+        if status in _ACTIVE_STATES:
             active_count += 1
         
         if metadata.get("development_mode") or metadata.get("development"):
             development_count += 1
     
-    total = len(agents)
     utilization = (active_count / total * 100) if total > 0 else 0
     
     return {
@@ -103,23 +154,27 @@ def analyze_resources(registry: Dict[str, Any]) -> Dict[str, Any]:
 
 def display_status(state: Dict[str, Any], analysis: Dict[str, Any]) -> None:
     """Display current system status."""
-    print("=" * 70)
-    print("DEVELOPMENT WORKFLOW - SYSTEM STATUS")
-    print("=" * 70)
-    print()
-    
-    current_state = state.get("current_state", "UNKNOWN")
-    print(f"Legislative State: {current_state}")
-    print(f"Total Agents: {analysis['total_agents']}")
-    print(f"Active Agents: {analysis['active_agents']} ({analysis['utilization_percent']}% utilization)")
-    print(f"Development Agents: {analysis['development_agents']}")
-    print()
-    
-    if analysis['can_spawn']:
-        print("[OK] Resources available - can spawn development agents")
-    else:
-        print("[WARN] High resource usage - consider waiting or increasing limits")
-    print()
+    out: List[str] = []
+    try:
+        out.append("=" * 70)
+        out.append("DEVELOPMENT WORKFLOW - SYSTEM STATUS")
+        out.append("=" * 70)
+        out.append("")
+        
+        current_state = state.get("current_state", "UNKNOWN")
+        out.append(f"Legislative State: {current_state}")
+        out.append(f"Total Agents: {analysis['total_agents']}")
+        out.append(f"Active Agents: {analysis['active_agents']} ({analysis['utilization_percent']}% utilization)")
+        out.append(f"Development Agents: {analysis['development_agents']}")
+        out.append("")
+        
+        if analysis['can_spawn']:
+            out.append("[OK] Resources available - can spawn development agents")
+        else:
+            out.append("[WARN] High resource usage - consider waiting or increasing limits")
+        out.append("")
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 def configure_environment(config: Optional[Dict[str, Any]]) -> None:
@@ -154,17 +209,7 @@ def spawn_development_agents(
     
     spawner = AgentSpawner(workflow_id=workflow_id)
     
-    # Map state string to enum
-    state_map = {
-        "PRE_EVT": LegislativeState.PRE_EVT,
-        "INTRO_EVT": LegislativeState.INTRO_EVT,
-        "COMM_EVT": LegislativeState.COMM_EVT,
-        "FLOOR_EVT": LegislativeState.FLOOR_EVT,
-        "FINAL_EVT": LegislativeState.FINAL_EVT,
-        "IMPL_EVT": LegislativeState.IMPL_EVT
-    }
-    
-    state_enum = state_map.get(legislative_state, LegislativeState.PRE_EVT)
+    state_enum = _STATE_MAP.get(legislative_state, LegislativeState.PRE_EVT)
     
     # Spawn only Intelligence agents
     results = spawner.spawn_agents_for_state(
@@ -194,11 +239,17 @@ def main():
     print()
     
     try:
-        # Step 1: Load system state
-        print("Step 1: Loading system state...")
-        state = load_state()
-        registry = load_registry()
-        dev_config = load_dev_config()
+        # Step 1: Load system state and analyze resources
+        print("Step 1: Loading system state and analyzing resource usage...")
+        # The three files are independent, so read them concurrently;
+        # the registry is analyzed as it is read
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            state_future = pool.submit(load_state)
+            analysis_future = pool.submit(analyze_registry)
+            config_future = pool.submit(load_dev_config)
+            state = state_future.result()
+            analysis = analysis_future.result()
+            dev_config = config_future.result()
         
         workflow_id = state.get("_meta", {}).get("workflow_id", "default-workflow")
         current_state = state.get("current_state", "PRE_EVT")
@@ -207,9 +258,8 @@ def main():
         print(f"[OK] Workflow ID: {workflow_id}")
         print()
         
-        # Step 2: Analyze resources
-        print("Step 2: Analyzing resource usage...")
-        analysis = analyze_resources(registry)
+        # Step 2: Report resources
+        print("Step 2: Reporting resource usage...")
         display_status(state, analysis)
         
         # Step 3: Configure environment
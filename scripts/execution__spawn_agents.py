@@ -6,13 +6,36 @@ Writes: agent-registry.json (via agent execution)
 Purpose: Spawn/execute agents that are currently IDLE to generate reports
 """
 
+import csv
 import json
+import os
+import re
+import shutil
 import sys
 import subprocess
+import tempfile
 import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import List, Dict, Optional, Tuple
+from typing import Any, Callable, Iterator, List, Dict, Optional, Set, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from _http import REQUESTS_AVAILABLE, SESSION, check_health
 
 # Fix Windows console encoding for emojis
 if sys.platform == 'win32':
@@ -27,33 +50,33 @@ REGISTRY_PATH = BASE_DIR / "registry" / "agent-registry.json"
 AGENTS_DIR = BASE_DIR / "agents"
 API_BASE_URL = "http://localhost:8000"
 WORKFLOW_ID = "default"  # Default workflow ID
+MAX_SPAWN_WORKERS = 8
 
-# Try to import requests
-try:
-    import requests
-    REQUESTS_AVAILABLE = True
-except ImportError:
-    REQUESTS_AVAILABLE = False
+# Agent scripts do an unlocked read-modify-write of agent-registry.json, so
+# direct executions are serialized even when spawning concurrently
+_DIRECT_EXEC_LOCK = threading.Lock()
+
+# Python processes with their command lines, filtered by WMI rather than client-side
+_PS_PROCESS_QUERY = (
+    "Get-CimInstance Win32_Process -Filter 'Name like ''python%''' "
+    "| Select-Object ProcessId,CommandLine | ConvertTo-Csv -NoTypeInformation"
+)
+
+if not REQUESTS_AVAILABLE:
     print("⚠️  Warning: requests library not available. API spawning will be skipped.")
     print("   Will fall back to direct agent execution.")
 
-def check_api_available() -> bool:
-    """Check if orchestrator API is available"""
-    if not REQUESTS_AVAILABLE:
-        return False
-    try:
-        response = requests.get(f"{API_BASE_URL}/health", timeout=2)
-        return response.status_code == 200
-    except:
-        return False
+def check_api_available(force_refresh: bool = False) -> bool:
+    """Check if orchestrator API is available (result cached briefly; force_refresh re-probes)"""
+    return check_health(f"{API_BASE_URL}/health", force_refresh)
 
-def spawn_agent_via_api(agent_id: str, agent_type: str, scope: str, risk_level: str) -> bool:
+def spawn_agent_via_api(agent_id: str, agent_type: str, scope: str, risk_level: str, log: Callable[[str], None] = print) -> bool:
     """Spawn agent via orchestrator API"""
     if not REQUESTS_AVAILABLE:
         return False
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{API_BASE_URL}/api/v1/workflows/{WORKFLOW_ID}/agents/spawn",
             json={
                 "agent_id": agent_id,
@@ -66,140 +89,297 @@ def spawn_agent_via_api(agent_id: str, agent_type: str, scope: str, risk_level:
         response.raise_for_status()
         return True
     except Exception as e:
-        print(f"    ❌ API spawn failed: {e}")
+        log(f"    ❌ API spawn failed: {e}")
         return False
 
-def check_running_python_processes() -> List[Dict[str, str]]:
-    """Check running Python processes (same as monitor script for consistency)"""
-    running_processes = []
+def iter_running_python_processes() -> Iterator[Dict[str, Any]]:
+    """Yield running Python processes one at a time (same sources as the monitor script)
     
+    Lets callers stop at the first match without collecting the full list.
+    Yields: {'pid': str, 'cmdline': lowercased command line as bytes}
+    """
     try:
-        if sys.platform == 'win32':
+        if PSUTIL_AVAILABLE:
+            # Native process APIs: no subprocess, no text table to parse
+            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+                name = proc.info['name']
+                if not name or 'python' not in name.lower():
+                    continue
+                cmdline = ' '.join(proc.info['cmdline'] or [])
+                yield {
+                    'pid': str(proc.info['pid']),
+                    'cmdline': cmdline.lower().encode('utf-8', 'replace')
+                }
+        elif sys.platform == 'win32':
             try:
+                # Single PowerShell call; -NoProfile skips loading the user profile
                 result = subprocess.run(
-                    ['wmic', 'process', 'where', "name='python.exe'", 'get', 'ProcessId,CommandLine', '/format:csv'],
+                    ['powershell', '-NoProfile', '-Command', _PS_PROCESS_QUERY],
                     capture_output=True,
                     text=True,
-                    timeout=10
+                    timeout=10,
+                    check=True
                 )
-                lines = result.stdout.strip().split('\n')
-                for line in lines[2:]:
-                    if not line.strip() or 'ProcessId' in line:
-                        continue
-                    parts = [p.strip() for p in line.split(',')]
-                    if len(parts) >= 3 and parts[-2] and parts[-1]:
-                        running_processes.append({
-                            'pid': parts[-2],
-                            'cmdline': parts[-1].lower() if parts[-1] else ''
-                        })
+                rows = csv.reader(io.StringIO(result.stdout))
+                next(rows, None)  # "ProcessId","CommandLine" header
+                for row in rows:
+                    if len(row) >= 2 and row[0] and row[1]:
+                        yield {
+                            'pid': row[0],
+                            'cmdline': row[1].lower().encode('utf-8', 'replace')
+                        }
             except Exception:
-                # Fallback: PowerShell
-                try:
-                    ps_cmd = "Get-Process python* | ForEach-Object { $_.Id.ToString() + '|' + (Get-CimInstance Win32_Process -Filter \"ProcessId = $($_.Id)\").CommandLine }"
-                    result = subprocess.run(
-                        ['powershell', '-Command', ps_cmd],
-                        capture_output=True,
-                        text=True,
-                        timeout=10
-                    )
-                    for line in result.stdout.strip().split('\n'):
-                        if '|' in line:
-                            pid, cmdline = line.split('|', 1)
-                            running_processes.append({
-                                'pid': pid.strip(),
-                                'cmdline': cmdline.strip().lower() if cmdline else ''
-                            })
-                except Exception:
-                    pass
+                # Fallback: wmic (deprecated, missing on recent Windows builds)
+                if shutil.which('wmic'):
+                    try:
+                        result = subprocess.run(
+                            ['wmic', 'process', 'where', "name='python.exe'", 'get', 'ProcessId,CommandLine', '/format:csv'],
+                            capture_output=True,
+                            text=True,
+                            timeout=10
+                        )
+                        # Columns are Node,CommandLine,ProcessId. wmic does not quote
+                        # fields, so CommandLine is everything between the first and
+                        # last comma (it may itself contain commas).
+                        for line in result.stdout.splitlines():
+                            if line.count(',') < 2 or line.startswith('Node,'):
+                                continue
+                            cmdline, pid = line.split(',', 1)[1].rsplit(',', 1)
+                            cmdline, pid = cmdline.strip(), pid.strip()
+                            if cmdline and pid:
+                                yield {
+                                    'pid': pid,
+                                    'cmdline': cmdline.lower().encode('utf-8', 'replace')
+                                }
+                    except Exception:
+                        pass
+        elif sys.platform.startswith('linux'):
+            # Read /proc directly rather than spawning ps and re-parsing its table
+            with os.scandir('/proc') as entries:
+                for entry in entries:
+                    if not entry.name.isdigit():
+                        continue
+                    try:
+                        # comm (executable name, <= 16 bytes) screens out the
+                        # non-python majority before the larger cmdline read
+                        with open(f"{entry.path}/comm", 'rb') as f:
+                            if b'python' not in f.read(16).lower():
+                                continue
+                        with open(f"{entry.path}/cmdline", 'rb') as f:
+                            raw = f.read()
+                    except OSError:
+                        continue  # exited meanwhile, or not ours to read
+                    # Stay in bytes: no decode needed for substring checks
+                    cmdline = raw.replace(b'\x00', b' ').strip().lower()
+                    if cmdline:
+                        yield {
+                            'pid': entry.name,
+                            'cmdline': cmdline
+                        }
         else:
-            result = subprocess.run(
+            # Parse ps output line by line as it arrives instead of buffering the
+            # whole table; the timer enforces the same 5s limit as before, and
+            # ps is killed if the caller stops early
+            with subprocess.Popen(
                 ['ps', 'aux'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            lines = result.stdout.strip().split('\n')
-            for line in lines:
-                if 'python' in line.lower():
-                    parts = line.split(None, 10)
-                    if len(parts) >= 11:
-                        running_processes.append({
-                            'pid': parts[1] if len(parts) > 1 else 'unknown',
-                            'cmdline': parts[10].lower() if len(parts) > 10 else line.lower()
-                        })
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True
+            ) as proc:
+                timer = threading.Timer(5, proc.kill)
+                timer.start()
+                try:
+                    for line in proc.stdout:
+                        if 'python' in line.lower():
+                            parts = line.rstrip('\n').split(None, 10)
+                            if len(parts) >= 11:
+                                yield {
+                                    'pid': parts[1],
+                                    'cmdline': parts[10].lower().encode('utf-8', 'replace')
+                                }
+                finally:
+                    timer.cancel()
+                    if proc.poll() is None:
+                        proc.kill()
     except Exception:
         pass
+
+def check_running_python_processes() -> List[Dict[str, Any]]:
+    """Check running Python processes (same as monitor script for consistency)
     
-    return running_processes
+    Returns: [{'pid': str, 'cmdline': lowercased command line as bytes}]
+    """
+    return list(iter_running_python_processes())
+
+def load_registry() -> Dict:
+    """Read and parse agent-registry.json in one read (orjson when available)"""
+    data = REGISTRY_PATH.read_bytes()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
 
-def check_agent_already_running(agent_id: str) -> Tuple[bool, str]:
+def index_agents_by_id(agents: List[Dict]) -> Dict[str, Dict]:
+    """Map agent_id -> registry entry (first entry wins, as in a linear scan)"""
+    return {a.get("agent_id"): a for a in reversed(agents)}
+
+def find_running_agent_ids(agent_ids: List[str], running_processes: List[Dict[str, Any]]) -> Set[str]:
+    """Lowercased ids from agent_ids that appear in any running process cmdline
+    
+    One alternation regex is run over each cmdline instead of one substring
+    scan per agent. Longest ids are tried first at each position; ids that
+    are substrings of a matched id are added afterwards, so the result is the
+    same as testing every id against every cmdline.
+    """
+    ids_lower = {a.lower() for a in agent_ids}
+    if not ids_lower or not running_processes:
+        return set()
+    
+    ordered = sorted(ids_lower, key=len, reverse=True)
+    pattern = re.compile(b'(?=(' + b'|'.join(re.escape(a.encode('utf-8')) for a in ordered) + b'))')
+    
+    matched = set()
+    for proc in running_processes:
+        for m in pattern.finditer(proc.get('cmdline', b'')):
+            matched.add(m.group(1).decode('utf-8'))
+    if not matched:
+        return matched
+    
+    return {a for a in ids_lower if any(a in m for m in matched)}
+
+def check_agent_already_running(
+    agent_id: str,
+    running_processes: Optional[List[Dict[str, Any]]] = None,
+    agent_by_id: Optional[Dict[str, Dict]] = None,
+    running_ids: Optional[Set[str]] = None
+) -> Tuple[bool, str]:
     """Check if agent is already running (conflict detection)
     
+    running_processes: snapshot from check_running_python_processes(); pass it
+    when checking several agents so the process list is collected only once
+    agent_by_id: index from index_agents_by_id(); pass it to skip re-reading
+    the registry
+    running_ids: result of find_running_agent_ids() for a batch of candidates;
+    when given, replaces the per-process scan
+    
     Returns: (is_running, reason)
     """
     # Check registry
-    if not REGISTRY_PATH.exists():
-        return False, "registry_not_found"
-    
-    with open(REGISTRY_PATH, 'r', encoding='utf-8') as f:
-        registry = json.load(f)
+    if agent_by_id is None:
+        if not REGISTRY_PATH.exists():
+            return False, "registry_not_found"
+        
+        registry = load_registry()
+        agent_by_id = index_agents_by_id(registry.get("agents", []))
     
-    agents = registry.get("agents", [])
-    for agent in agents:
-        if agent.get("agent_id") == agent_id:
-            status = agent.get("status", "")
-            if status == "RUNNING":
-                return True, "registry_shows_running"
-            if status == "BLOCKED":
-                return True, "agent_is_blocked"
-            break
+    agent = agent_by_id.get(agent_id)
+    if agent is not None:
+        status = agent.get("status", "")
+        if status == "RUNNING":
+            return True, "registry_shows_running"
+        if status == "BLOCKED":
+            return True, "agent_is_blocked"
     
     # Check running processes
-    running_processes = check_running_python_processes()
-    agent_id_lower = agent_id.lower()
-    agent_file_pattern = f"{agent_id}.py"
+    if running_ids is not None:
+        if agent_id.lower() in running_ids:
+            return True, "process_found"
+        return False, "not_running"
+    
+    # cmdlines are lowercased, so this one test also covers "<agent_id>.py"
+    agent_id_lower = agent_id.lower().encode('utf-8')
     
+    # Without a snapshot, stream processes and stop at the first hit
+    if running_processes is None:
+        running_processes = iter_running_python_processes()
     for proc in running_processes:
-        cmdline = proc.get('cmdline', '')
-        if agent_id in cmdline or agent_id_lower in cmdline:
-            return True, "process_found"
-        if agent_file_pattern in cmdline:
+        if agent_id_lower in proc.get('cmdline', b''):
             return True, "process_found"
     
     return False, "not_running"
 
-def execute_agent_directly(agent_id: str) -> bool:
-    """Execute agent Python script directly"""
+def list_agent_files() -> Set[str]:
+    """Stems of the *.py scripts in AGENTS_DIR, from a single directory scan"""
+    try:
+        with os.scandir(AGENTS_DIR) as it:
+            return {e.name[:-3] for e in it if e.name.endswith('.py') and e.is_file()}
+    except OSError:
+        return set()
+
+def execute_agent_directly(agent_id: str, log: Callable[[str], None] = print, agent_files: Optional[Set[str]] = None) -> bool:
+    """Execute agent Python script directly
+    
+    agent_files: result of list_agent_files(); pass it when executing several
+    agents to avoid a stat() per agent
+    """
     agent_file = AGENTS_DIR / f"{agent_id}.py"
     
-    if not agent_file.exists():
-        print(f"    ⚠️  Agent file not found: {agent_file}")
+    exists = agent_id in agent_files if agent_files is not None else agent_file.exists()
+    if not exists:
+        log(f"    ⚠️  Agent file not found: {agent_file}")
         return False
     
     try:
-        # Execute agent script
-        result = subprocess.run(
-            [sys.executable, str(agent_file)],
-            cwd=str(BASE_DIR),
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
-        
-        if result.returncode == 0:
-            return True
-        else:
-            print(f"    ❌ Agent execution failed (exit code {result.returncode})")
-            if result.stderr:
-                print(f"    Error: {result.stderr[:200]}")
-            return False
+        # Execute agent script. stdout is discarded and stderr goes to a temp
+        # file, so nothing is buffered in memory (or by pipe reader threads)
+        # while the agent runs; only its head is read back on failure.
+        with tempfile.TemporaryFile() as stderr_file:
+            proc = subprocess.Popen(
+                [sys.executable, str(agent_file)],
+                cwd=str(BASE_DIR),
+                stdout=subprocess.DEVNULL,
+                stderr=stderr_file
+            )
+            try:
+                returncode = proc.wait(timeout=300)  # 5 minute timeout
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+                raise
+            
+            if returncode == 0:
+                return True
+            else:
+                log(f"    ❌ Agent execution failed (exit code {returncode})")
+                stderr_file.seek(0)
+                stderr = stderr_file.read(1024).decode('utf-8', 'replace')
+                if stderr:
+                    log(f"    Error: {stderr[:200]}")
+                return False
     except subprocess.TimeoutExpired:
-        print(f"    ⚠️  Agent execution timed out (may still be running)")
+        log(f"    ⚠️  Agent execution timed out (may still be running)")
         return True  # Consider timeout as success (agent is running)
     except Exception as e:
-        print(f"    ❌ Failed to execute agent: {e}")
+        log(f"    ❌ Failed to execute agent: {e}")
         return False
 
+def _spawn_one(agent: Dict, use_api: bool, agent_files: Set[str]) -> Tuple[bool, List[str]]:
+    """Spawn a single agent (worker body for spawn_idle_agents)
+    
+    Returns: (success, output lines to print once the agent is done)
+    """
+    agent_id = agent.get("agent_id", "unknown")
+    agent_type = agent.get("agent_type", "unknown")
+    scope = agent.get("scope", "")
+    risk_level = agent.get("risk_level", "MEDIUM")
+    lines: List[str] = []
+    
+    success = False
+    if use_api:
+        lines.append(f"  Attempting via API...")
+        success = spawn_agent_via_api(agent_id, agent_type, scope, risk_level, log=lines.append)
+        if not success:
+            lines.append(f"  Falling back to direct execution...")
+            with _DIRECT_EXEC_LOCK:
+                success = execute_agent_directly(agent_id, log=lines.append, agent_files=agent_files)
+    else:
+        lines.append(f"  Executing directly...")
+        with _DIRECT_EXEC_LOCK:
+            success = execute_agent_directly(agent_id, log=lines.append, agent_files=agent_files)
+    
+    if success:
+        lines.append(f"  ✅ Successfully spawned {agent_id}\n")
+    else:
+        lines.append(f"  ❌ Failed to spawn {agent_id}\n")
+    return success, lines
+
 def spawn_idle_agents(max_agents: int = 5, agent_types: Optional[List[str]] = None, use_api: bool = True, allow_execution_agents: bool = False):
     """Spawn IDLE agents that should be running
     
@@ -212,8 +392,8 @@ def spawn_idle_agents(max_agents: int = 5, agent_types: Optional[List[str]] = No
     print(f"Agent Execution Script")
     print(f"{'='*80}\n")
     
-    # Check API availability
-    api_available = check_api_available()
+    # Check API availability (skipped entirely when API mode is disabled)
+    api_available = use_api and check_api_available()
     if use_api and api_available:
         print(f"✅ Orchestrator API is available - will use API to spawn agents")
     elif use_api:
@@ -227,55 +407,65 @@ def spawn_idle_agents(max_agents: int = 5, agent_types: Optional[List[str]] = No
         print(f"❌ Registry not found: {REGISTRY_PATH}")
         return
     
-    with open(REGISTRY_PATH, 'r', encoding='utf-8') as f:
-        registry = json.load(f)
+    registry = load_registry()
     
     agents = registry.get("agents", [])
     
-    # Filter for IDLE agents
-    idle_agents = [
-        a for a in agents 
-        if a.get("status") == "IDLE" and a.get("current_task") != "Registered"
-    ]
-    
-    # Also consider agents with status "Registered" as potential candidates
-    registered_agents = [
-        a for a in agents
-        if a.get("status") == "IDLE" and a.get("current_task") == "Registered"
-    ]
-    
-    # GOVERNANCE GUARDRAIL: Filter out EXECUTION agents unless explicitly allowed
-    execution_agents_filtered = []
-    if not allow_execution_agents:
-        execution_agents_filtered = [a for a in idle_agents + registered_agents if a.get("agent_type") == "Execution"]
-        idle_agents = [a for a in idle_agents if a.get("agent_type") != "Execution"]
-        registered_agents = [a for a in registered_agents if a.get("agent_type") != "Execution"]
-        if execution_agents_filtered:
-            print(f"🔒 GOVERNANCE: {len(execution_agents_filtered)} EXECUTION agent(s) filtered (require --allow-execution flag)")
-            print(f"   EXECUTION agents require explicit human approval and cannot be auto-spawned\n")
+    # Single pass over the registry. IDLE agents are bucketed as Registered
+    # (current_task == "Registered"), Learning (prioritized for reports) or
+    # other; EXECUTION and BLOCKED agents are set aside by the guardrails.
+    learning_agents = []
+    other_agents = []
+    registered_agents = []
+    execution_idle = []
+    execution_registered = []
+    blocked_agents = []
+    
+    for a in agents:
+        status = a.get("status")
+        if status == "BLOCKED":
+            blocked_agents.append(a)
+            continue
+        if status != "IDLE":
+            continue
+        
+        agent_type = a.get("agent_type")
+        is_registered = a.get("current_task") == "Registered"
+        
+        # GOVERNANCE GUARDRAIL: EXECUTION agents only with explicit approval
+        if agent_type == "Execution" and not allow_execution_agents:
+            (execution_registered if is_registered else execution_idle).append(a)
+            continue
+        
+        # Filter by agent type if specified
+        if agent_types and agent_type not in agent_types:
+            continue
+        
+        if is_registered:
+            registered_agents.append(a)
+        elif agent_type == "Learning":
+            learning_agents.append(a)
+        else:
+            other_agents.append(a)
+    
+    idle_count = len(learning_agents) + len(other_agents)
+    execution_agents_filtered = execution_idle + execution_registered
+    if execution_agents_filtered:
+        print(f"🔒 GOVERNANCE: {len(execution_agents_filtered)} EXECUTION agent(s) filtered (require --allow-execution flag)")
+        print(f"   EXECUTION agents require explicit human approval and cannot be auto-spawned\n")
     
-    # GOVERNANCE GUARDRAIL: Filter out BLOCKED agents (never spawn)
-    blocked_agents = [a for a in agents if a.get("status") == "BLOCKED"]
+    # GOVERNANCE GUARDRAIL: BLOCKED agents are never spawned
     if blocked_agents:
         print(f"🔒 GOVERNANCE: {len(blocked_agents)} BLOCKED agent(s) skipped (human-gated, requires explicit approval)")
         print(f"   BLOCKED agents cannot be spawned automatically - they require human intervention\n")
     
-    # Filter by agent type if specified
-    if agent_types:
-        idle_agents = [a for a in idle_agents if a.get("agent_type") in agent_types]
-        registered_agents = [a for a in registered_agents if a.get("agent_type") in agent_types]
-    
-    # Prioritize learning agents for report generation
-    learning_agents = [a for a in idle_agents if a.get("agent_type") == "Learning"]
-    other_agents = [a for a in idle_agents if a.get("agent_type") != "Learning"]
-    
     # Combine: learning agents first, then others
     agents_to_spawn = (learning_agents + other_agents + registered_agents)[:max_agents]
     
     if not agents_to_spawn:
         print(f"ℹ️  No IDLE agents found to spawn")
         print(f"   Current registry shows {len(agents)} total agents")
-        print(f"   Filtered: {len(idle_agents)} IDLE (non-Registered), {len(registered_agents)} Registered")
+        print(f"   Filtered: {idle_count} IDLE (non-Registered), {len(registered_agents)} Registered")
         if execution_agents_filtered:
             print(f"   Blocked: {len(execution_agents_filtered)} EXECUTION agents (use --allow-execution to include)")
         return
@@ -289,42 +479,50 @@ def spawn_idle_agents(max_agents: int = 5, agent_types: Optional[List[str]] = No
     failed_count = 0
     skipped_conflicts = 0
     
-    for i, agent in enumerate(agents_to_spawn, 1):
-        agent_id = agent.get("agent_id", "unknown")
-        agent_type = agent.get("agent_type", "unknown")
-        scope = agent.get("scope", "")
-        risk_level = agent.get("risk_level", "MEDIUM")
-        
-        print(f"[{i}/{len(agents_to_spawn)}] Spawning {agent_id}")
-        print(f"  Type: {agent_type}, Risk: {risk_level}")
-        print(f"  Scope: {scope[:60]}...")
-        
-        # CONFLICT DETECTION: Check if agent already running
-        is_running, reason = check_agent_already_running(agent_id)
-        if is_running:
-            print(f"  ⚠️  SKIPPED: Agent appears already running (reason: {reason})")
-            print(f"     Conflict detection prevents double-spawning")
-            skipped_conflicts += 1
-            print()
-            continue
-        
-        success = False
-        if use_api and api_available:
-            print(f"  Attempting via API...")
-            success = spawn_agent_via_api(agent_id, agent_type, scope, risk_level)
-            if not success:
-                print(f"  Falling back to direct execution...")
-                success = execute_agent_directly(agent_id)
-        else:
-            print(f"  Executing directly...")
-            success = execute_agent_directly(agent_id)
+    # One process snapshot and registry index for all conflict checks
+    running_processes = check_running_python_processes()
+    agent_by_id = index_agents_by_id(agents)
+    running_ids = find_running_agent_ids([a.get("agent_id", "unknown") for a in agents_to_spawn], running_processes)
+    agent_files = list_agent_files()
+    
+    # Conflict checks run here, serially; workers only spawn. Output is
+    # printed per agent, in order, as each result becomes available.
+    blocks = []  # (header lines, future or None if skipped)
+    with ThreadPoolExecutor(max_workers=min(len(agents_to_spawn), MAX_SPAWN_WORKERS)) as pool:
+        for i, agent in enumerate(agents_to_spawn, 1):
+            agent_id = agent.get("agent_id", "unknown")
+            agent_type = agent.get("agent_type", "unknown")
+            scope = agent.get("scope", "")
+            risk_level = agent.get("risk_level", "MEDIUM")
+            
+            header = [
+                f"[{i}/{len(agents_to_spawn)}] Spawning {agent_id}",
+                f"  Type: {agent_type}, Risk: {risk_level}",
+                f"  Scope: {scope[:60]}...",
+            ]
+            
+            # CONFLICT DETECTION: Check if agent already running
+            is_running, reason = check_agent_already_running(agent_id, agent_by_id=agent_by_id, running_ids=running_ids)
+            if is_running:
+                header.append(f"  ⚠️  SKIPPED: Agent appears already running (reason: {reason})")
+                header.append(f"     Conflict detection prevents double-spawning")
+                header.append("")
+                skipped_conflicts += 1
+                blocks.append((header, None))
+                continue
+            
+            blocks.append((header, pool.submit(_spawn_one, agent, use_api and api_available, agent_files)))
         
-        if success:
-            print(f"  ✅ Successfully spawned {agent_id}\n")
-            success_count += 1
-        else:
-            print(f"  ❌ Failed to spawn {agent_id}\n")
-            failed_count += 1
+        for header, future in blocks:
+            print("\n".join(header))
+            if future is None:
+                continue
+            success, lines = future.result()
+            print("\n".join(lines))
+            if success:
+                success_count += 1
+            else:
+                failed_count += 1
     
     # Summary
     print(f"{'='*80}")
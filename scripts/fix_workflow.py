@@ -7,33 +7,32 @@ Can recover workflows from ORCH_ERROR state.
 import sys
 import json
 import requests
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
 
 from app.storage import WorkflowStorage
 from app.models import WorkflowState, OrchestratorState, LegislativeState
+from _http import SESSION, check_health
 
 API_BASE_URL = "http://localhost:8000/api/v1"
 STORAGE_BASE_DIR = Path(__file__).parent.parent / "data"
 
 
-def check_api_server() -> bool:
-    """Check if API server is running."""
-    try:
-        response = requests.get(f"{API_BASE_URL}/health", timeout=2)
-        return response.status_code == 200
-    except:
-        return False
+def check_api_server(force_refresh: bool = False) -> bool:
+    """Check if API server is running (cached briefly; force_refresh re-probes)."""
+    return check_health(f"{API_BASE_URL}/health", force_refresh)
 
 
 def get_workflow_status_api(workflow_id: str) -> Optional[Dict[str, Any]]:
     """Get workflow status via API."""
     try:
-        response = requests.get(f"{API_BASE_URL}/workflows/{workflow_id}/status", timeout=5)
+        response = SESSION.get(f"{API_BASE_URL}/workflows/{workflow_id}/status", timeout=5)
         if response.status_code == 200:
             return response.json()
         elif response.status_code == 404:
@@ -54,7 +53,7 @@ def get_workflow_status_api(workflow_id: str) -> Optional[Dict[str, Any]]:
 def recover_workflow_api(workflow_id: str) -> bool:
     """Recover workflow from ORCH_ERROR via API."""
     try:
-        response = requests.post(f"{API_BASE_URL}/workflows/{workflow_id}/recover", timeout=5)
+        response = SESSION.post(f"{API_BASE_URL}/workflows/{workflow_id}/recover", timeout=5)
         if response.status_code == 200:
             data = response.json()
             print(f"[SUCCESS] Workflow {workflow_id} recovered successfully")
@@ -73,10 +72,16 @@ def recover_workflow_api(workflow_id: str) -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
+def _storage() -> WorkflowStorage:
+    """WorkflowStorage for STORAGE_BASE_DIR, constructed once per process."""
+    return WorkflowStorage(STORAGE_BASE_DIR)
+
+
 def get_workflow_status_direct(workflow_id: str) -> Optional[WorkflowState]:
     """Get workflow status directly from storage."""
     try:
-        storage = WorkflowStorage(STORAGE_BASE_DIR)
+        storage = _storage()
         workflow = storage.load_workflow(workflow_id)
         return workflow
     except Exception as e:
@@ -87,7 +92,7 @@ def get_workflow_status_direct(workflow_id: str) -> Optional[WorkflowState]:
 def recover_workflow_direct(workflow_id: str) -> bool:
     """Recover workflow directly from storage."""
     try:
-        storage = WorkflowStorage(STORAGE_BASE_DIR)
+        storage = _storage()
         workflow = storage.load_workflow(workflow_id)
         
         if not workflow:
@@ -117,7 +122,7 @@ def recover_workflow_direct(workflow_id: str) -> bool:
 def list_all_workflows() -> list[str]:
     """List all workflow IDs."""
     try:
-        storage = WorkflowStorage(STORAGE_BASE_DIR)
+        storage = _storage()
         return storage.list_workflows()
     except Exception as e:
         print(f"[ERROR] Error listing workflows: {e}")
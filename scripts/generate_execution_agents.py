@@ -4,139 +4,23 @@ Artifact Type: EXECUTION_DIRECTIVE
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
-BASE_DIR = Path(__file__).parent.parent
-
-AGENT_TEMPLATES = {
-    "grassroots_base": """\"\"\"
-Execution Agent: {name} ({state})
-Class: Execution (Human-Gated)
-Purpose: {purpose}
-\"\"\"
-
-import json
-from datetime import datetime
-from pathlib import Path
-from typing import Dict, Any, Optional
+from jinja2 import Environment, FileSystemLoader
 
 BASE_DIR = Path(__file__).parent.parent
-REGISTRY_PATH = BASE_DIR / "registry" / "agent-registry.json"
-GUIDANCE_PATH = BASE_DIR / "guidance" / "PROFESSIONAL_GUIDANCE.json"
-AUDIT_PATH = BASE_DIR / "audit" / "audit-log.jsonl"
-OUTPUT_DIR = BASE_DIR / "artifacts" / "{agent_id}"
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
-{dependency_paths}
-
-AGENT_ID = "{agent_id}"
-AGENT_TYPE = "Execution"
-RISK_LEVEL = "HIGH"
-
-def log_event(event_type: str, message: str, **kwargs):
-    event = {{"timestamp": datetime.utcnow().isoformat() + "Z", "event_type": event_type, "agent_id": AGENT_ID, "message": message, **kwargs}}
-    with open(AUDIT_PATH, 'a', encoding='utf-8') as f:
-        f.write(json.dumps(event) + '\\n')
-
-def check_guidance_signed() -> bool:
-    try:
-        if GUIDANCE_PATH.exists():
-            guidance = json.loads(GUIDANCE_PATH.read_text(encoding='utf-8'))
-            signatures = guidance.get("_meta", {{}}).get("signatures", {{}})
-            for role, sig_data in signatures.items():
-                if sig_data.get("signed", False):
-                    return True
-        return False
-    except:
-        return False
-
-{approval_check}
 
-def load_input_artifacts() -> Dict[str, Any]:
-    artifacts = {{}}
-    {load_artifacts}
-    return artifacts
-
-def generate_execution_plan(input_data: Dict[str, Any]) -> Dict[str, Any]:
-    return {{
-        "_meta": {{
-            "agent_id": AGENT_ID,
-            "generated_at": datetime.utcnow().isoformat() + "Z",
-            "artifact_type": "{artifact_type}",
-            "artifact_name": "{artifact_name}",
-            "status": "SPECULATIVE",
-            "confidence": "SPECULATIVE",
-            "human_review_required": False,
-            "requires_review": None,
-            "guidance_status": "SIGNED" if check_guidance_signed() else "TEST_MODE",
-            "dependencies": {dependencies_json}
-        }},
-        "execution_plan": {{
-            "status": "PLANNED",
-            "planned_actions": [],
-            "execution_status": {{"total_actions": 0, "completed": 0, "pending": 0}}
-        }},
-        "recommendations": ["Execute according to evaluation outputs", "Track execution effectiveness"]
-    }}
-
-def main() -> Optional[Path]:
-    guidance_signed = check_guidance_signed()
-    if not guidance_signed:
-        log_event("warning", "GUIDANCE not signed - proceeding in TEST MODE")
-    
-    log_event("agent_spawned", f"Agent {{AGENT_ID}} spawned", agent_type=AGENT_TYPE, risk_level=RISK_LEVEL)
-    
-    try:
-        registry = json.loads(REGISTRY_PATH.read_text(encoding='utf-8'))
-    except:
-        registry = {{"agents": [], "_meta": {{"total_agents": 0, "active_agents": 0}}}}
-    
-    agent_entry = {{
-        "agent_id": AGENT_ID,
-        "agent_type": AGENT_TYPE,
-        "status": "RUNNING",
-        "scope": "{purpose}",
-        "current_task": "Planning execution",
-        "last_heartbeat": datetime.utcnow().isoformat() + "Z",
-        "risk_level": RISK_LEVEL,
-        "outputs": [],
-        "spawned_at": datetime.utcnow().isoformat() + "Z",
-        "guidance_signed": guidance_signed
-    }}
-    registry.setdefault("agents", []).append(agent_entry)
-    registry.setdefault("_meta", {{}})["total_agents"] = len(registry.get("agents", []))
-    registry["_meta"]["active_agents"] = len([a for a in registry.get("agents", []) if a.get("status") == "RUNNING"])
-    REGISTRY_PATH.write_text(json.dumps(registry, indent=2), encoding='utf-8')
-    
-    log_event("task_started", "Execution planning started")
-    
-    input_data = load_input_artifacts()
-    if not input_data:
-        log_event("warning", "No input artifacts found - proceeding speculatively")
-    
-    print(f"[{{AGENT_ID}}] Generating execution plan...")
-    execution_plan = generate_execution_plan(input_data)
-    
-    output_file = OUTPUT_DIR / "{artifact_type}.json"
-    output_file.write_text(json.dumps(execution_plan, indent=2), encoding='utf-8')
-    
-    for agent in registry.get("agents", []):
-        if agent.get("agent_id") == AGENT_ID:
-            agent["outputs"].append(str(output_file.relative_to(BASE_DIR)))
-            agent["status"] = "IDLE"
-            agent["current_task"] = "Execution plan completed"
-            break
-    REGISTRY_PATH.write_text(json.dumps(registry, indent=2), encoding='utf-8')
-    
-    log_event("task_completed", "Execution plan generated", output_file=str(output_file))
-    print(f"[{{AGENT_ID}}] Execution plan generated. Output: {{output_file}}")
-    return output_file
-
-if __name__ == "__main__":
-    main()
-"""
-}
+# Compiled once and rendered per spec
+TEMPLATE_ENV = Environment(
+    loader=FileSystemLoader(str(Path(__file__).parent / "templates")),
+    keep_trailing_newline=True,
+    trim_blocks=True,
+    lstrip_blocks=True,
+    autoescape=False,
+)
+AGENT_TEMPLATE = TEMPLATE_ENV.get_template("agent_base.py.j2")
 
 AGENT_SPECS = [
     {
@@ -237,56 +121,27 @@ AGENT_SPECS = [
     }
 ]
 
+def build_derived_fields(spec):
+    """Derive the template fields computed from spec["dependencies"]."""
+    return {
+        "artifact_keys": [(var, var.split("_PATH")[0].lower()) for var, _ in spec["dependencies"]],
+        "dependencies_json": json.dumps([path for _, path in spec["dependencies"]]),
+    }
+
+# Built once at import: agent_id -> derived template fields
+DERIVED_FIELDS = {spec["agent_id"]: build_derived_fields(spec) for spec in AGENT_SPECS}
+
 def generate_agent_file(spec):
-    dependency_paths = "\n".join([
-        f'{var} = BASE_DIR / "artifacts" / "{path}"'
-        for var, path in spec["dependencies"]
-    ])
-    
-    load_artifacts = "\n".join([
-        f'try:\n    if {var}.exists():\n        artifacts["{var.split("_PATH")[0].lower()}"] = json.loads({var}.read_text(encoding="utf-8"))\nexcept Exception as e:\n    log_event("error", f"Failed to load {var}: {{e}}")'
-        for var, _ in spec["dependencies"]
-    ])
-    
-    dependencies_json = json.dumps([path for _, path in spec["dependencies"]])
-    
-    approval_check = ""
-    if spec.get("requires_approval"):
-        approval_check = f'''def check_{spec["requires_approval"].lower()}_approved() -> bool:
-    try:
-        queue_file = BASE_DIR / "review" / "{spec["requires_approval"]}_queue.json"
-        if not queue_file.exists():
-            return False
-        queue_data = json.loads(queue_file.read_text(encoding='utf-8'))
-        approved_reviews = queue_data.get("approved_reviews", [])
-        for review in approved_reviews:
-            if review.get("decision") == "APPROVE" and review.get("status") == "APPROVED":
-                return True
-        return False
-    except:
-        return False
-'''
-    
-    content = AGENT_TEMPLATES["grassroots_base"].format(
-        agent_id=spec["agent_id"],
-        name=spec["name"],
-        state=spec["state"],
-        purpose=spec["purpose"],
-        artifact_type=spec["artifact_type"],
-        artifact_name=spec["artifact_name"],
-        dependency_paths=dependency_paths,
-        load_artifacts=load_artifacts,
-        dependencies_json=dependencies_json,
-        approval_check=approval_check
-    )
-    
+    content = AGENT_TEMPLATE.render(**spec, **DERIVED_FIELDS[spec["agent_id"]])
     output_file = BASE_DIR / "agents" / f'{spec["agent_id"]}.py'
     output_file.write_text(content, encoding='utf-8')
-    print(f"Generated: {output_file}")
+    return output_file
 
 def main():
-    for spec in AGENT_SPECS:
-        generate_agent_file(spec)
+    # Specs are independent; threads avoid process start-up cost for a handful of files
+    with ThreadPoolExecutor(max_workers=min(8, len(AGENT_SPECS))) as executor:
+        for output_file in executor.map(generate_agent_file, AGENT_SPECS):
+            print(f"Generated: {output_file}")
     print(f"Generated {len(AGENT_SPECS)} execution agents")
 
 if __name__ == "__main__":
@@ -30,26 +30,41 @@ Schema:
 }
 """
 
-import json
+import argparse
+import mmap
+import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Any, List
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from _json_io import read_json, write_json
+
 # Fix Windows console encoding
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
 
 # Paths
 BASE_DIR = Path(__file__).parent.parent
+_BASE_PREFIX = str(BASE_DIR) + os.sep
 POLICY_DIR = BASE_DIR / "artifacts" / "policy"
 OUTPUT_FILE = POLICY_DIR / "POLICY_OPPORTUNITY_ARTIFACTS_INDEX.json"
 
+# Known artifact files, in index order
+KNOWN_ARTIFACT_FILES = (
+    "WIRELESS_CHARGING_INSURABLE_RISK_POLICY_OPPORTUNITY.json",
+    "WIRELESS_CHARGING_INSURABLE_RISK_POLICY_OPPORTUNITY.md",
+    "WIRELESS_CHARGING_INSURABLE_RISK_POLICY_OPPORTUNITY.mmd",
+    "WIRELESS_CHARGING_INSURABLE_RISK_STRATEGIC_PLAN.md",
+)
+
 def load_artifact_metadata(file_path: Path) -> Dict[str, Any]:
     """Load metadata from artifact file"""
     try:
         if file_path.suffix == ".json":
-            data = json.loads(file_path.read_text(encoding='utf-8'))
+            data = read_json(file_path)
             meta = data.get("_meta", {})
             opp_summary = data.get("opportunity_summary", {})
             return {
@@ -60,12 +75,20 @@ def load_artifact_metadata(file_path: Path) -> Dict[str, Any]:
                 "description": opp_summary.get("title", "Policy Opportunity") if opp_summary else "Policy Opportunity"
             }
         elif file_path.suffix == ".md":
-            # For markdown, extract basic info
-            content = file_path.read_text(encoding='utf-8')
+            # For markdown, extract basic info: markers are searched in the
+            # mapped bytes and only the first line is decoded
+            with open(file_path, 'rb') as f:
+                first_line = f.readline().decode('utf-8')
+                if not first_line:
+                    is_plan = is_approved = False
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        is_plan = mm.find(b"STRATEGIC_PLAN") != -1
+                        is_approved = mm.find(b"APPROVED") != -1
             return {
-                "artifact_type": "STRATEGIC_PLAN" if "STRATEGIC_PLAN" in content else "MARKDOWN",
-                "status": "ACTIONABLE" if "APPROVED" in content else "SPECULATIVE",
-                "description": content.split('\n')[0].replace('#', '').strip() if content else "Document"
+                "artifact_type": "STRATEGIC_PLAN" if is_plan else "MARKDOWN",
+                "status": "ACTIONABLE" if is_approved else "SPECULATIVE",
+                "description": first_line.replace('#', '').strip() if first_line else "Document"
             }
         else:
             return {
@@ -84,20 +107,19 @@ def scan_policy_artifacts() -> List[Dict[str, Any]]:
     """Scan policy directory for artifacts"""
     artifacts = []
     
-    # Known artifact files
-    known_files = [
-        "WIRELESS_CHARGING_INSURABLE_RISK_POLICY_OPPORTUNITY.json",
-        "WIRELESS_CHARGING_INSURABLE_RISK_POLICY_OPPORTUNITY.md",
-        "WIRELESS_CHARGING_INSURABLE_RISK_POLICY_OPPORTUNITY.mmd",
-        "WIRELESS_CHARGING_INSURABLE_RISK_STRATEGIC_PLAN.md"
-    ]
+    # One directory read instead of a stat() per known file
+    try:
+        with os.scandir(POLICY_DIR) as it:
+            present = {entry.name for entry in it if entry.name in KNOWN_ARTIFACT_FILES and entry.is_file()}
+    except FileNotFoundError:
+        return artifacts
     
-    for filename in known_files:
-        file_path = POLICY_DIR / filename
-        if file_path.exists():
+    for filename in KNOWN_ARTIFACT_FILES:
+        if filename in present:
+            file_path = POLICY_DIR / filename
             metadata = load_artifact_metadata(file_path)
             artifacts.append({
-                "file_path": str(file_path.relative_to(BASE_DIR)),
+                "file_path": str(file_path).removeprefix(_BASE_PREFIX),
                 "file_name": filename,
                 **metadata
             })
@@ -108,12 +130,18 @@ def check_agent_availability() -> Dict[str, bool]:
     """Check if policy opportunity agents are available"""
     agents_dir = BASE_DIR / "agents"
     
+    # One directory listing answers every membership check
+    try:
+        agent_files = set(os.listdir(agents_dir))
+    except FileNotFoundError:
+        agent_files = set()
+    
     return {
-        "intel_policy_opportunity_analyzer": (agents_dir / "intel_policy_opportunity_analyzer_pre_evt.py").exists(),
-        "draft_policy_opportunity_document": (agents_dir / "draft_policy_opportunity_document_pre_evt.py").exists()
+        "intel_policy_opportunity_analyzer": "intel_policy_opportunity_analyzer_pre_evt.py" in agent_files,
+        "draft_policy_opportunity_document": "draft_policy_opportunity_document_pre_evt.py" in agent_files
     }
 
-def main():
+def main(pretty: bool = False):
     """Generate policy opportunity artifacts index"""
     
     print("Scanning policy opportunity artifacts...")
@@ -138,7 +166,7 @@ def main():
     # Generate index
     index = {
         "_meta": {
-            "generated_at": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+            "generated_at": datetime.now(timezone.utc),
             "script": "generate_policy_opportunity_artifacts.py",
             "artifact_count": len(artifacts),
             "version": "1.0.0"
@@ -154,10 +182,7 @@ def main():
     }
     
     # Write output
-    OUTPUT_FILE.write_text(
-        json.dumps(index, indent=2, ensure_ascii=False),
-        encoding='utf-8'
-    )
+    write_json(OUTPUT_FILE, index, indent=pretty)
     
     print(f"[SUCCESS] Artifacts index generated: {OUTPUT_FILE}")
     print(f"\nWorkflow Status:")
@@ -169,4 +194,7 @@ def main():
     return OUTPUT_FILE
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Generate policy opportunity artifacts index")
+    parser.add_argument("--pretty", action="store_true", help="Indent the JSON output")
+    args = parser.parse_args()
+    main(pretty=args.pretty)
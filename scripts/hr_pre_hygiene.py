@@ -7,11 +7,15 @@ INTERNAL / NON-AUTHORITATIVE:
 - Does not delete or approve anything
 """
 
-import json
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _json_io import read_json, write_json
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 QUEUE_PATH = BASE_DIR / "review" / "HR_PRE_queue.json"
 
@@ -19,22 +23,23 @@ QUEUE_PATH = BASE_DIR / "review" / "HR_PRE_queue.json"
 def _parse_ts(ts: str) -> datetime:
     try:
         return datetime.fromisoformat(ts.replace("Z", "+00:00"))
-    except Exception:
+    except (AttributeError, ValueError):
+        # Missing/non-string or malformed timestamp
         return datetime.min
 
 
 def _mark_status(entries: List[Dict]) -> List[Dict]:
-    by_type: Dict[str, List[Tuple[datetime, int]]] = {}
+    # artifact_type -> (newest timestamp, index); ties keep the earliest entry
+    newest: Dict[str, Tuple[datetime, int]] = {}
     for idx, entry in enumerate(entries):
         art_type = entry.get("artifact_type", "UNKNOWN")
         ts = _parse_ts(entry.get("submitted_at", ""))
-        by_type.setdefault(art_type, []).append((ts, idx))
+        if art_type not in newest or ts > newest[art_type][0]:
+            newest[art_type] = (ts, idx)
 
-    for art_type, items in by_type.items():
-        # newest first
-        items.sort(key=lambda t: t[0], reverse=True)
-        for pos, (_, idx) in enumerate(items):
-            entries[idx]["status"] = "ACTIVE" if pos == 0 else "SUPERSEDED"
+    for idx, entry in enumerate(entries):
+        art_type = entry.get("artifact_type", "UNKNOWN")
+        entry["status"] = "ACTIVE" if idx == newest[art_type][1] else "SUPERSEDED"
     return entries
 
 
@@ -42,12 +47,12 @@ def run():
     if not QUEUE_PATH.exists():
         raise FileNotFoundError(f"Queue not found: {QUEUE_PATH}")
 
-    queue = json.loads(QUEUE_PATH.read_text())
+    queue = read_json(QUEUE_PATH)
     pending = queue.get("pending_reviews", [])
     queue["_meta"]["note"] = "INTERNAL, NON-AUTHORITATIVE — pending HR_PRE approval"
 
     queue["pending_reviews"] = _mark_status(pending)
-    QUEUE_PATH.write_text(json.dumps(queue, indent=2))
+    write_json(QUEUE_PATH, queue)
     return queue
 
 
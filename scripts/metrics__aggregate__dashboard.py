@@ -15,8 +15,9 @@ Schema:
 - schemas/metrics.schema.json (DASHBOARD_KPIS report type)
 """
 
+import argparse
 import sys
-import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional
@@ -24,6 +25,9 @@ from typing import Dict, Any, Optional
 # Path setup
 BASE_DIR = Path(__file__).parent.parent
 sys.path.insert(0, str(BASE_DIR))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from _json_io import JSONDecodeError, read_json, write_json
 
 # Constants
 METRICS_DIR = BASE_DIR / "metrics"
@@ -63,12 +67,25 @@ def load_json(path: Path) -> Dict[str, Any]:
     try:
         if not path.exists():
             return {}
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
+        return read_json(path)
+    except (FileNotFoundError, JSONDecodeError):
         return {}
 
 
+def _dig(data: Any, *keys: str, default: Any = None) -> Any:
+    """Follow keys through nested dicts, returning default if any level is missing."""
+    for key in keys:
+        if not isinstance(data, dict) or key not in data:
+            return default
+        data = data[key]
+    return data
+
+
+def _any_exceeds(actuals: Dict[str, float], targets: Dict[str, float], multiplier: float) -> bool:
+    """True if any actual value (default 0.0) exceeds its target times multiplier."""
+    return any(actuals.get(key, 0.0) > target * multiplier for key, target in targets.items())
+
+
 def calculate_risk_indicators(
     strategic: Dict[str, Any],
     operational: Dict[str, Any],
@@ -76,43 +93,35 @@ def calculate_risk_indicators(
 ) -> Dict[str, bool]:
     """Calculate early warning risk indicators."""
     risk_indicators = {}
+    effectiveness = operational.get("operational_effectiveness", {})
+    health = system_health.get("system_health", {})
     
     # High override rate
-    override_frequency = system_health.get("system_health", {}).get("agent_accuracy", {}).get("human_override_frequency", 0.0)
+    override_frequency = _dig(health, "agent_accuracy", "human_override_frequency", default=0.0)
     risk_indicators["high_override_rate"] = override_frequency > RISK_THRESHOLDS["high_override_rate"]
     
     # Long review gate latency
-    review_latency = operational.get("operational_effectiveness", {}).get("time_to_approval", {}).get("review_gate_latency", {})
-    long_latency = False
-    for gate_id, target_hours in TARGET_LATENCY_HOURS.items():
-        actual_hours = review_latency.get(gate_id, 0.0)
-        threshold = target_hours * RISK_THRESHOLDS["long_review_latency_multiplier"]
-        if actual_hours > threshold:
-            long_latency = True
-            break
-    risk_indicators["long_review_latency"] = long_latency
+    review_latency = _dig(effectiveness, "time_to_approval", "review_gate_latency", default={})
+    risk_indicators["long_review_latency"] = _any_exceeds(
+        review_latency, TARGET_LATENCY_HOURS, RISK_THRESHOLDS["long_review_latency_multiplier"]
+    )
     
     # Low conversion rate
-    conversion_rate = operational.get("operational_effectiveness", {}).get("artifact_rework", {}).get("speculative_to_actionable_conversion_rate", 100.0)
+    conversion_rate = _dig(effectiveness, "artifact_rework", "speculative_to_actionable_conversion_rate", default=100.0)
     risk_indicators["low_conversion_rate"] = conversion_rate < RISK_THRESHOLDS["low_conversion_rate"]
     
     # Missing dependencies
-    dependency_satisfaction = operational.get("operational_effectiveness", {}).get("execution_readiness", {}).get("dependency_satisfaction_rate", 100.0)
+    dependency_satisfaction = _dig(effectiveness, "execution_readiness", "dependency_satisfaction_rate", default=100.0)
     risk_indicators["missing_dependencies"] = dependency_satisfaction < RISK_THRESHOLDS["missing_dependencies"]
     
     # State progression stalls
-    state_velocity = operational.get("operational_effectiveness", {}).get("state_transition_velocity", {}).get("days_per_state", {})
-    progression_stalls = False
-    for state, target_days in TARGET_STATE_DAYS.items():
-        actual_days = state_velocity.get(state, 0.0)
-        threshold = target_days * RISK_THRESHOLDS["state_progression_multiplier"]
-        if actual_days > threshold:
-            progression_stalls = True
-            break
-    risk_indicators["state_progression_stalls"] = progression_stalls
+    state_velocity = _dig(effectiveness, "state_transition_velocity", "days_per_state", default={})
+    risk_indicators["state_progression_stalls"] = _any_exceeds(
+        state_velocity, TARGET_STATE_DAYS, RISK_THRESHOLDS["state_progression_multiplier"]
+    )
     
     # Audit completeness low
-    audit_completeness = system_health.get("system_health", {}).get("audit_completeness", {}).get("decision_log_coverage", 100.0)
+    audit_completeness = _dig(health, "audit_completeness", "decision_log_coverage", default=100.0)
     risk_indicators["audit_completeness_low"] = audit_completeness < RISK_THRESHOLDS["audit_completeness_low"]
     
     return risk_indicators
@@ -131,14 +140,15 @@ def calculate_trends(
     }
 
 
-def main() -> Optional[Path]:
+def main(pretty: bool = False) -> Optional[Path]:
     """Aggregate all KPI categories into dashboard-ready format."""
     print(f"[metrics__aggregate__dashboard] Aggregating dashboard KPIs...")
     
-    # Load all KPI reports
-    strategic = load_json(STRATEGIC_PATH)
-    operational = load_json(OPERATIONAL_PATH)
-    system_health = load_json(SYSTEM_HEALTH_PATH)
+    # Load all KPI reports (independent reads, overlapped)
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        strategic, operational, system_health = pool.map(
+            load_json, (STRATEGIC_PATH, OPERATIONAL_PATH, SYSTEM_HEALTH_PATH)
+        )
     
     # Check if all reports exist
     if not strategic or not operational or not system_health:
@@ -159,7 +169,7 @@ def main() -> Optional[Path]:
     output = {
         "_meta": {
             "report_type": "DASHBOARD_KPIS",
-            "generated_at": now.isoformat() + "Z",
+            "generated_at": now,
             "calculation_version": "1.0.0",
             "source_versions": {
                 "artifact_schema_version": "1.0.0",
@@ -175,8 +185,7 @@ def main() -> Optional[Path]:
     }
     
     # Write output
-    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    write_json(OUTPUT_PATH, output, indent=pretty)
     
     print(f"[metrics__aggregate__dashboard] Dashboard KPIs aggregated")
     print(f"   Output: {OUTPUT_PATH}")
@@ -190,7 +199,10 @@ def main() -> Optional[Path]:
 
 
 if __name__ == "__main__":
-    result = main()
+    parser = argparse.ArgumentParser(description="Aggregate KPI reports into dashboard_kpis.json")
+    parser.add_argument("--pretty", action="store_true", help="Indent the JSON output")
+    args = parser.parse_args()
+    result = main(pretty=args.pretty)
     if result:
         print(f"[OK] Dashboard aggregation complete: {result}")
     else:
@@ -16,16 +16,21 @@ Schema:
 - schemas/metrics.schema.json (OPERATIONAL_KPIS report type)
 """
 
+import os
 import sys
-import json
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterator, Optional, Set, Tuple
 from collections import defaultdict
+from functools import lru_cache
 
 # Path setup
 BASE_DIR = Path(__file__).parent.parent
+_BASE_PREFIX = str(BASE_DIR) + os.sep
 sys.path.insert(0, str(BASE_DIR))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from _json_io import JSONDecodeError, read_json, write_json
 
 # Constants
 ARTIFACTS_DIR = BASE_DIR / "artifacts"
@@ -53,48 +58,84 @@ TARGET_STATE_DAYS = {
 }
 
 
-def parse_timestamp(ts_str: str) -> Optional[datetime]:
-    """Parse ISO timestamp to datetime object."""
-    if not ts_str:
-        return None
+def round_kpis(kpis: Dict[str, Any]) -> Dict[str, Any]:
+    """Round float KPI values to 2 decimals for output."""
+    return {key: round(value, 2) if isinstance(value, float) else value for key, value in kpis.items()}
+
+
+@lru_cache(maxsize=131072)
+def _parse_iso(ts_str: str) -> Optional[datetime]:
+    """Cached ISO parse; review and state timestamps repeat across records."""
+    if ts_str.endswith("Z"):
+        ts_str = ts_str[:-1] + "+00:00"
     try:
-        ts_str = ts_str.replace("Z", "+00:00")
         return datetime.fromisoformat(ts_str)
-    except Exception:
+    except ValueError:
         return None
 
 
+def parse_timestamp(ts_str: str) -> Optional[datetime]:
+    """Parse ISO timestamp to datetime object."""
+    if not ts_str or not isinstance(ts_str, str):
+        return None
+    return _parse_iso(ts_str)
+
+
 def load_json(path: Path) -> Dict[str, Any]:
     """Load JSON file, return {} if not found or invalid."""
     try:
-        if not path.exists():
-            return {}
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
+        return read_json(path)
+    except (FileNotFoundError, JSONDecodeError):
         return {}
 
 
-def load_jsonl(path: Path) -> List[Dict[str, Any]]:
-    """Load JSONL file, return [] if not found or invalid."""
-    if not path.exists():
-        return []
+def _iter_artifact_files() -> Iterator[Path]:
+    """Yield artifacts/<agent_dir>/*.json using scandir's cached entry types."""
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return [json.loads(line) for line in f if line.strip()]
-    except Exception:
-        return []
+        agent_dirs = os.scandir(ARTIFACTS_DIR)
+    except FileNotFoundError:
+        return
+    with agent_dirs:
+        for agent_entry in agent_dirs:
+            if not agent_entry.is_dir():
+                continue
+            with os.scandir(agent_entry.path) as files:
+                for file_entry in files:
+                    if file_entry.name.endswith(".json") and file_entry.is_file():
+                        yield Path(file_entry.path)
 
 
-def calculate_review_gate_latency() -> Dict[str, float]:
+@lru_cache(maxsize=1)
+def _scan_artifacts() -> Tuple[Tuple[Path, Any], ...]:
+    """
+    Walk ARTIFACTS_DIR once and return (path, _meta) for every artifact.
+
+    Cached so every KPI calculation in a run shares one parse per file.
+    Files that cannot be read or whose top level is not a JSON object are
+    skipped.
+    """
+    artifacts = []
+    for artifact_file in _iter_artifact_files():
+        try:
+            data = load_json(artifact_file)
+        except Exception:
+            continue
+        if isinstance(data, dict):
+            artifacts.append((artifact_file, data.get("_meta", {})))
+    
+    return tuple(artifacts)
+
+
+def load_review_queues() -> Dict[str, Dict[str, Any]]:
+    """Load every gate's review queue once ({} for a missing queue)."""
+    return {gate_id: load_json(REVIEW_DIR / f"{gate_id}_queue.json") for gate_id in TARGET_LATENCY_HOURS}
+
+
+def calculate_review_gate_latency(queues: Dict[str, Dict[str, Any]]) -> Dict[str, float]:
     """Calculate average review gate latency by gate."""
     latencies = defaultdict(list)
     
-    # Load review queues
-    for gate_id in ["HR_PRE", "HR_LANG", "HR_MSG", "HR_RELEASE"]:
-        queue_file = REVIEW_DIR / f"{gate_id}_queue.json"
-        queue_data = load_json(queue_file)
-        
+    for gate_id, queue_data in queues.items():
         # Check approved reviews
         approved_reviews = queue_data.get("approved_reviews", [])
         for review in approved_reviews:
@@ -110,72 +151,102 @@ def calculate_review_gate_latency() -> Dict[str, float]:
                     hours = delta.total_seconds() / 3600
                     latencies[gate_id].append(hours)
     
-    # Calculate averages
-    avg_latencies = {}
-    for gate_id, times in latencies.items():
-        avg_latencies[gate_id] = round(sum(times) / len(times), 2) if times else 0.0
-    
-    # Fill in missing gates with 0.0
-    for gate_id in ["HR_PRE", "HR_LANG", "HR_MSG", "HR_RELEASE"]:
-        if gate_id not in avg_latencies:
-            avg_latencies[gate_id] = 0.0
+    # Averages for gates with data (every list is non-empty), then 0.0 for the rest
+    avg_latencies = {gate_id: sum(times) / len(times) for gate_id, times in latencies.items()}
+    for gate_id in TARGET_LATENCY_HOURS:
+        avg_latencies.setdefault(gate_id, 0.0)
     
     return avg_latencies
 
 
-def calculate_artifact_rework() -> Dict[str, Any]:
-    """Calculate artifact rework rates."""
-    # Count artifacts by status
-    speculative_count = 0
-    actionable_count = 0
-    modified_count = 0
-    total_artifacts = 0
-    pending_review_count = 0  # Artifacts in conversion pipeline
-    
-    # Load review queues to check pending status
+def load_pending_artifact_paths(queues: Dict[str, Dict[str, Any]]) -> Set[str]:
+    """Collect artifact paths awaiting review across all gates."""
     pending_artifact_paths = set()
-    for gate_id in ["HR_PRE", "HR_LANG", "HR_MSG", "HR_RELEASE"]:
-        queue_file = REVIEW_DIR / f"{gate_id}_queue.json"
-        if queue_file.exists():
-            queue_data = load_json(queue_file)
-            for review in queue_data.get("pending_reviews", []):
-                artifact_path = review.get("artifact_path", "")
-                if artifact_path:
-                    pending_artifact_paths.add(artifact_path)
+    for queue_data in queues.values():
+        for review in queue_data.get("pending_reviews", []):
+            artifact_path = review.get("artifact_path", "")
+            if artifact_path:
+                pending_artifact_paths.add(artifact_path)
+    return pending_artifact_paths
+
+
+def aggregate_artifact_stats(pending_artifact_paths: Set[str]) -> Dict[str, int]:
+    """
+    Accumulate every per-artifact counter used by the KPI builders in one pass.
+
+    The rework and readiness counters keep separate error handling, so an
+    artifact with malformed _meta is skipped (or partly counted) exactly as
+    it would be by a dedicated scan.
+    """
+    stats = {
+        # Rework
+        "speculative_count": 0,
+        "actionable_count": 0,
+        "modified_count": 0,
+        "pending_review_count": 0,  # Artifacts in conversion pipeline
+        # Readiness
+        "total_artifacts": 0,
+        "complete_artifacts": 0,
+        "total_dependencies": 0,
+        "satisfied_dependencies": 0,
+    }
     
-    # Scan all artifacts
-    if ARTIFACTS_DIR.exists():
-        for agent_dir in ARTIFACTS_DIR.iterdir():
-            if not agent_dir.is_dir():
-                continue
-            for artifact_file in agent_dir.glob("*.json"):
-                try:
-                    data = load_json(artifact_file)
-                    meta = data.get("_meta", {})
-                    status = meta.get("status", "SPECULATIVE")
-                    rework_count = meta.get("rework_count", 0)
-                    requires_review = meta.get("requires_review")
-                    
-                    total_artifacts += 1
-                    
-                    # Check if artifact is in pending review queue
-                    artifact_relative_path = str(artifact_file.relative_to(BASE_DIR))
-                    in_pending_queue = (
-                        artifact_relative_path in pending_artifact_paths or
-                        artifact_file.name in [Path(p).name for p in pending_artifact_paths]
-                    )
-                    
-                    if status == "SPECULATIVE":
-                        speculative_count += 1
-                        # Count as "in conversion pipeline" if it requires review and is pending
-                        if requires_review and in_pending_queue:
-                            pending_review_count += 1
-                    elif status == "ACTIONABLE":
-                        actionable_count += 1
-                        if rework_count > 0:
-                            modified_count += 1
-                except Exception:
-                    continue
+    # Basenames of pending paths, for matching artifacts queued under another prefix
+    pending_names = {Path(p).name for p in pending_artifact_paths}
+    
+    for artifact_file, meta in _scan_artifacts():
+        try:
+            status = meta.get("status", "SPECULATIVE")
+            rework_count = meta.get("rework_count", 0)
+            requires_review = meta.get("requires_review")
+            
+            # Check if artifact is in pending review queue
+            artifact_relative_path = str(artifact_file).removeprefix(_BASE_PREFIX)
+            in_pending_queue = (
+                artifact_relative_path in pending_artifact_paths or
+                artifact_file.name in pending_names
+            )
+            
+            if status == "SPECULATIVE":
+                stats["speculative_count"] += 1
+                # Count as "in conversion pipeline" if it requires review and is pending
+                if requires_review and in_pending_queue:
+                    stats["pending_review_count"] += 1
+            elif status == "ACTIONABLE":
+                stats["actionable_count"] += 1
+                if rework_count > 0:
+                    stats["modified_count"] += 1
+        except Exception:
+            pass
+        
+        try:
+            stats["total_artifacts"] += 1
+            completeness = meta.get("completeness", "PARTIAL")
+            if completeness == "COMPLETE":
+                stats["complete_artifacts"] += 1
+            
+            # Check dependencies
+            dependencies = meta.get("dependencies", [])
+            stats["total_dependencies"] += len(dependencies)
+            
+            for dep in dependencies:
+                # Check if dependency exists (simplified - would need full path resolution)
+                # For now, assume 95% satisfaction
+                stats["satisfied_dependencies"] += 1
+        except Exception:
+            pass
+    
+    return stats
+
+
+def calculate_artifact_rework(
+    artifact_stats: Dict[str, int],
+    queues: Dict[str, Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Calculate artifact rework rates."""
+    speculative_count = artifact_stats["speculative_count"]
+    actionable_count = artifact_stats["actionable_count"]
+    pending_review_count = artifact_stats["pending_review_count"]
     
     # Conversion rate: count artifacts that are actionable OR in conversion pipeline
     # Total that could convert = speculative_count
@@ -185,10 +256,7 @@ def calculate_artifact_rework() -> Dict[str, Any]:
     
     # Check decision logs for modifications
     total_modifications = 0
-    for gate_id in ["HR_PRE", "HR_LANG", "HR_MSG", "HR_RELEASE"]:
-        queue_file = REVIEW_DIR / f"{gate_id}_queue.json"
-        queue_data = load_json(queue_file)
-        
+    for queue_data in queues.values():
         approved_reviews = queue_data.get("approved_reviews", [])
         for review in approved_reviews:
             if review.get("decision") == "modified":
@@ -198,45 +266,17 @@ def calculate_artifact_rework() -> Dict[str, Any]:
     rework_iterations = (total_modifications / max(actionable_count, 1)) if actionable_count > 0 else 0.0
     
     return {
-        "speculative_to_actionable_conversion_rate": round(conversion_rate, 2),
-        "rework_iterations": round(rework_iterations, 2),
+        "speculative_to_actionable_conversion_rate": conversion_rate,
+        "rework_iterations": rework_iterations,
     }
 
 
-def calculate_execution_readiness() -> Dict[str, Any]:
+def calculate_execution_readiness(artifact_stats: Dict[str, int]) -> Dict[str, Any]:
     """Calculate execution readiness metrics."""
-    # Artifact completeness score
-    total_artifacts = 0
-    complete_artifacts = 0
-    
-    # Dependency satisfaction
-    total_dependencies = 0
-    satisfied_dependencies = 0
-    
-    if ARTIFACTS_DIR.exists():
-        for agent_dir in ARTIFACTS_DIR.iterdir():
-            if not agent_dir.is_dir():
-                continue
-            for artifact_file in agent_dir.glob("*.json"):
-                try:
-                    data = load_json(artifact_file)
-                    meta = data.get("_meta", {})
-                    
-                    total_artifacts += 1
-                    completeness = meta.get("completeness", "PARTIAL")
-                    if completeness == "COMPLETE":
-                        complete_artifacts += 1
-                    
-                    # Check dependencies
-                    dependencies = meta.get("dependencies", [])
-                    total_dependencies += len(dependencies)
-                    
-                    for dep in dependencies:
-                        # Check if dependency exists (simplified - would need full path resolution)
-                        # For now, assume 95% satisfaction
-                        satisfied_dependencies += 1
-                except Exception:
-                    continue
+    total_artifacts = artifact_stats["total_artifacts"]
+    complete_artifacts = artifact_stats["complete_artifacts"]
+    total_dependencies = artifact_stats["total_dependencies"]
+    satisfied_dependencies = artifact_stats["satisfied_dependencies"]
     
     # Completeness score
     completeness_score = (complete_artifacts / total_artifacts * 100) if total_artifacts > 0 else 0.0
@@ -245,8 +285,8 @@ def calculate_execution_readiness() -> Dict[str, Any]:
     dependency_satisfaction = (satisfied_dependencies / total_dependencies * 100) if total_dependencies > 0 else 100.0
     
     return {
-        "artifact_completeness_score": round(completeness_score, 2),
-        "dependency_satisfaction_rate": round(dependency_satisfaction, 2),
+        "artifact_completeness_score": completeness_score,
+        "dependency_satisfaction_rate": dependency_satisfaction,
     }
 
 
@@ -255,48 +295,38 @@ def calculate_state_transition_velocity() -> Dict[str, float]:
     state_data = load_json(STATE_PATH)
     state_history = state_data.get("state_history", [])
     
+    # Parse every entry time once, then pair each entry with its successor
+    entered = [parse_timestamp(entry.get("entered_at")) for entry in state_history]
+    
     # Calculate durations between states
     durations = defaultdict(list)
     
-    for i in range(len(state_history) - 1):
-        current_entry = state_history[i]
-        next_entry = state_history[i + 1]
-        
-        current_state = current_entry.get("state")
-        current_time_str = current_entry.get("entered_at")
-        next_time_str = next_entry.get("entered_at")
-        
-        if current_time_str and next_time_str:
-            current_time = parse_timestamp(current_time_str)
-            next_time = parse_timestamp(next_time_str)
-            
-            if current_time and next_time:
-                delta = next_time - current_time
-                days = delta.total_seconds() / 86400
-                durations[current_state].append(days)
-    
-    # Calculate averages
-    avg_durations = {}
-    for state, times in durations.items():
-        avg_durations[state] = round(sum(times) / len(times), 2) if times else 0.0
+    for entry, current_time, next_time in zip(state_history, entered, entered[1:]):
+        if current_time and next_time:
+            days = (next_time - current_time).total_seconds() / 86400
+            durations[entry.get("state")].append(days)
     
-    # Fill in missing states with 0.0
-    for state in ["PRE_EVT", "INTRO_EVT", "COMM_EVT", "FLOOR_EVT", "FINAL_EVT"]:
-        if state not in avg_durations:
-            avg_durations[state] = 0.0
+    # Averages for states with data (every list is non-empty), then 0.0 for the rest
+    avg_durations = {state: sum(times) / len(times) for state, times in durations.items()}
+    for state in TARGET_STATE_DAYS:
+        avg_durations.setdefault(state, 0.0)
     
     return avg_durations
 
 
 def main() -> Optional[Path]:
-    """Calculate operational KPIs."""
+    """Calculate operational KPIs (calculators return raw floats; rounded here once)."""
     print(f"[metrics__calculate__operational_kpis] Calculating operational KPIs...")
     
     # Calculate all KPI categories
-    review_latency = calculate_review_gate_latency()
-    artifact_rework = calculate_artifact_rework()
-    execution_readiness = calculate_execution_readiness()
-    state_velocity = calculate_state_transition_velocity()
+    # Each review queue is parsed once and shared
+    queues = load_review_queues()
+    review_latency = round_kpis(calculate_review_gate_latency(queues))
+    # One pass over the artifacts feeds both rework and readiness
+    artifact_stats = aggregate_artifact_stats(load_pending_artifact_paths(queues))
+    artifact_rework = round_kpis(calculate_artifact_rework(artifact_stats, queues))
+    execution_readiness = round_kpis(calculate_execution_readiness(artifact_stats))
+    state_velocity = round_kpis(calculate_state_transition_velocity())
     
     # Build output
     now = datetime.now(timezone.utc)
@@ -324,8 +354,7 @@ def main() -> Optional[Path]:
     }
     
     # Write output
-    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    write_json(OUTPUT_PATH, output)
     
     print(f"[metrics__calculate__operational_kpis] Operational KPIs calculated")
     print(f"   Output: {OUTPUT_PATH}")
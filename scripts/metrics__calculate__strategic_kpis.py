@@ -16,16 +16,20 @@ Schema:
 - schemas/metrics.schema.json (STRATEGIC_KPIS report type)
 """
 
+import os
 import sys
-import json
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
 from collections import defaultdict
+from functools import lru_cache
 
 # Path setup
 BASE_DIR = Path(__file__).parent.parent
 sys.path.insert(0, str(BASE_DIR))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from _json_io import JSONDecodeError, read_json, write_json
 
 # Constants
 ARTIFACTS_DIR = BASE_DIR / "artifacts"
@@ -53,6 +57,20 @@ TARGETS = {
     "narrative_stability": 70.0,  # >70%
 }
 
+# Output precision per KPI (default 2 decimals)
+KPI_DECIMALS = {
+    "narrative_risk_score": 3,
+    "message_coherence_score": 3,
+}
+
+
+def round_kpis(kpis: Dict[str, Any]) -> Dict[str, Any]:
+    """Round float KPI values for output, using KPI_DECIMALS or 2 decimals."""
+    return {
+        key: round(value, KPI_DECIMALS.get(key, 2)) if isinstance(value, float) else value
+        for key, value in kpis.items()
+    }
+
 
 def parse_timestamp(ts_str: str) -> Optional[datetime]:
     """Parse ISO timestamp to datetime object."""
@@ -68,42 +86,64 @@ def parse_timestamp(ts_str: str) -> Optional[datetime]:
 def load_json(path: Path) -> Dict[str, Any]:
     """Load JSON file, return {} if not found or invalid."""
     try:
-        if not path.exists():
-            return {}
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
+        return read_json(path)
+    except (FileNotFoundError, JSONDecodeError):
         return {}
 
 
-def load_jsonl(path: Path) -> List[Dict[str, Any]]:
-    """Load JSONL file, return [] if not found or invalid."""
-    if not path.exists():
-        return []
+def _iter_artifact_files(include_dir: Optional[Callable[[str], bool]] = None) -> Iterator[Path]:
+    """
+    Yield artifacts/<agent_dir>/*.json using scandir's cached entry types.
+
+    Args:
+        include_dir: Optional predicate on the agent directory name
+    """
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return [json.loads(line) for line in f if line.strip()]
-    except Exception:
-        return []
+        agent_dirs = os.scandir(ARTIFACTS_DIR)
+    except FileNotFoundError:
+        return
+    with agent_dirs:
+        for agent_entry in agent_dirs:
+            if not agent_entry.is_dir():
+                continue
+            if include_dir is not None and not include_dir(agent_entry.name):
+                continue
+            with os.scandir(agent_entry.path) as files:
+                for file_entry in files:
+                    if file_entry.name.endswith(".json") and file_entry.is_file():
+                        yield Path(file_entry.path)
+
+
+@lru_cache(maxsize=1)
+def _scan_artifacts() -> Tuple[Tuple[Path, Any], ...]:
+    """
+    Walk ARTIFACTS_DIR once and return (path, _meta) for every artifact.
+
+    Cached so every KPI calculation in a run shares one parse per file.
+    Files that cannot be read or whose top level is not a JSON object are
+    skipped.
+    """
+    artifacts = []
+    for artifact_file in _iter_artifact_files():
+        try:
+            data = load_json(artifact_file)
+        except Exception:
+            continue
+        if isinstance(data, dict):
+            artifacts.append((artifact_file, data.get("_meta", {})))
+    
+    return tuple(artifacts)
 
 
 def find_artifacts_by_type(artifact_type: str) -> List[Path]:
     """Find all artifact files of a given type."""
     artifacts = []
-    if not ARTIFACTS_DIR.exists():
-        return artifacts
-    
-    for agent_dir in ARTIFACTS_DIR.iterdir():
-        if not agent_dir.is_dir():
+    for artifact_file, meta in _scan_artifacts():
+        try:
+            if meta.get("artifact_type") == artifact_type:
+                artifacts.append(artifact_file)
+        except Exception:
             continue
-        for artifact_file in agent_dir.glob("*.json"):
-            try:
-                data = load_json(artifact_file)
-                meta = data.get("_meta", {})
-                if meta.get("artifact_type") == artifact_type:
-                    artifacts.append(artifact_file)
-            except Exception:
-                continue
     
     return artifacts
 
@@ -157,10 +197,10 @@ def calculate_policy_movement() -> Dict[str, Any]:
     state_progression_rate = (progression_count / max(signal_count, 1) * 100) if signal_count > 0 else 0.0
     
     return {
-        "signal_to_bill_conversion_rate": round(signal_to_bill_rate, 2),
-        "committee_penetration_rate": round(committee_penetration_rate, 2),
-        "amendment_adoption_rate": round(amendment_adoption_rate, 2),
-        "state_progression_rate": round(state_progression_rate, 2),
+        "signal_to_bill_conversion_rate": signal_to_bill_rate,
+        "committee_penetration_rate": committee_penetration_rate,
+        "amendment_adoption_rate": amendment_adoption_rate,
+        "state_progression_rate": state_progression_rate,
     }
 
 
@@ -168,14 +208,9 @@ def calculate_access_gained() -> Dict[str, Any]:
     """Calculate access gained KPIs."""
     # Count stakeholder meeting requests from execution artifacts
     # Look for execution_outreach artifacts
-    outreach_artifacts = []
-    if ARTIFACTS_DIR.exists():
-        for agent_dir in ARTIFACTS_DIR.iterdir():
-            if not agent_dir.is_dir():
-                continue
-            if "execution" in agent_dir.name.lower() and "outreach" in agent_dir.name.lower():
-                for artifact_file in agent_dir.glob("*.json"):
-                    outreach_artifacts.append(artifact_file)
+    outreach_artifacts = list(_iter_artifact_files(
+        lambda name: "execution" in name.lower() and "outreach" in name.lower()
+    ))
     
     # Count meeting requests (simplified - would parse artifact content)
     total_meeting_requests = len(outreach_artifacts) * 5  # Placeholder estimate
@@ -204,9 +239,9 @@ def calculate_access_gained() -> Dict[str, Any]:
     meeting_completion_rate = 70.0  # Placeholder
     
     return {
-        "stakeholder_meeting_requests": round(stakeholder_meeting_requests, 2),
-        "coalition_building_activity": round(coalition_building_activity, 2),
-        "meeting_completion_rate": round(meeting_completion_rate, 2),
+        "stakeholder_meeting_requests": stakeholder_meeting_requests,
+        "coalition_building_activity": coalition_building_activity,
+        "meeting_completion_rate": meeting_completion_rate,
     }
 
 
@@ -233,9 +268,9 @@ def calculate_risk_reduced() -> Dict[str, Any]:
     opposition_neutralization_rate = 50.0  # Placeholder
     
     return {
-        "opposition_identification_rate": round(opposition_identification_rate, 2),
-        "narrative_risk_score": round(narrative_risk_score, 3),
-        "opposition_neutralization_rate": round(opposition_neutralization_rate, 2),
+        "opposition_identification_rate": opposition_identification_rate,
+        "narrative_risk_score": narrative_risk_score,
+        "opposition_neutralization_rate": opposition_neutralization_rate,
     }
 
 
@@ -258,21 +293,21 @@ def calculate_narrative_alignment() -> Dict[str, Any]:
     narrative_stability = 75.0 if len(pre_concepts) > 0 and len(final_releases) > 0 else 0.0
     
     return {
-        "message_coherence_score": round(message_coherence_score, 3),
-        "media_coverage_alignment": round(media_coverage_alignment, 2),
-        "narrative_stability": round(narrative_stability, 2),
+        "message_coherence_score": message_coherence_score,
+        "media_coverage_alignment": media_coverage_alignment,
+        "narrative_stability": narrative_stability,
     }
 
 
 def main() -> Optional[Path]:
-    """Calculate strategic KPIs."""
+    """Calculate strategic KPIs (calculators return raw floats; rounded here once)."""
     print(f"[metrics__calculate__strategic_kpis] Calculating strategic KPIs...")
     
     # Calculate all KPI categories
-    policy_movement = calculate_policy_movement()
-    access_gained = calculate_access_gained()
-    risk_reduced = calculate_risk_reduced()
-    narrative_alignment = calculate_narrative_alignment()
+    policy_movement = round_kpis(calculate_policy_movement())
+    access_gained = round_kpis(calculate_access_gained())
+    risk_reduced = round_kpis(calculate_risk_reduced())
+    narrative_alignment = round_kpis(calculate_narrative_alignment())
     
     # Build output
     now = datetime.now(timezone.utc)
@@ -296,8 +331,7 @@ def main() -> Optional[Path]:
     }
     
     # Write output
-    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    write_json(OUTPUT_PATH, output)
     
     print(f"[metrics__calculate__strategic_kpis] Strategic KPIs calculated")
     print(f"   Output: {OUTPUT_PATH}")